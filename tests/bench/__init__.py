@@ -0,0 +1 @@
+"""Micro-benchmarks for Upbit Trading Bot (pytest-benchmark)."""
\ No newline at end of file
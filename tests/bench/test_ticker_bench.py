@@ -0,0 +1,46 @@
+"""Micro-benchmarks for Ticker validation and serialization.
+
+Run with ``make test-bench`` (``pytest tests/bench/ --benchmark-only``).
+Skipped entirely when pytest-benchmark is not installed.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from upbit_trading_bot.data.models import Ticker
+
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(scope="module")
+def ticker():
+    """Fixed, valid ticker shared by all benchmarks."""
+    return Ticker(
+        market="KRW-BTC",
+        trade_price=50000000.0,
+        trade_volume=1.5,
+        timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        change_rate=0.01
+    )
+
+
+def test_ticker_validate_bench(benchmark, ticker):
+    assert benchmark(ticker.validate)
+
+
+def test_ticker_to_dict_bench(benchmark, ticker):
+    benchmark(ticker.to_dict)
+
+
+def test_ticker_from_dict_bench(benchmark, ticker):
+    result = benchmark(Ticker.from_dict, ticker.to_dict())
+    assert result.market == ticker.market
+
+
+def test_ticker_from_json_bench(benchmark, ticker):
+    result = benchmark(Ticker.from_json, ticker.to_json())
+    assert result.market == ticker.market
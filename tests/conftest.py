@@ -7,6 +7,31 @@ import tempfile
 import os
 from pathlib import Path
 from unittest.mock import Mock
+from hypothesis import settings, HealthCheck, Phase
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+
+# Hypothesis profiles (select with HYPOTHESIS_PROFILE=<name>; unset keeps the defaults)
+# ci: deterministic CI runs (make test-ci) - 10 examples, no example database,
+# no deadline or shrinking
+settings.register_profile(
+    "ci",
+    max_examples=10,
+    deadline=None,
+    derandomize=True,
+    database=None,
+    phases=[Phase.explicit, Phase.reuse, Phase.generate],
+    suppress_health_check=[HealthCheck.too_slow]
+)
+# dev: local re-runs (make test-dev) - replay failures saved in the repo-root
+# .hypothesis/ example database before generating new examples
+settings.register_profile(
+    "dev",
+    database=DirectoryBasedExampleDatabase(
+        str(Path(__file__).resolve().parent.parent / ".hypothesis" / "examples")
+    )
+)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "default"))
 
 
 @pytest.fixture
@@ -18,6 +18,18 @@ from upbit_trading_bot.data.models import (
 )
 
 
+# 생성기에서 반복 사용하는 기본 전략들 (모듈 로드 시 한 번만 생성)
+_MARKET_TRENDS = st.sampled_from(['bullish', 'bearish', 'neutral'])
+_ORDER_TYPES = st.sampled_from(['initial', 'averaging'])
+_TIMESTAMPS = st.datetimes(
+    min_value=datetime(2020, 1, 1),
+    max_value=datetime(2030, 12, 31)
+)
+# 마켓 심볼은 ASCII이므로 유니코드 카테고리 대신 정규식 기반 생성기 사용
+_MARKET_TEXT = st.from_regex(r'[A-Za-z0-9]{1,20}', fullmatch=True)
+_SUSPENSION_REASONS = st.text(min_size=1, max_size=100)
+
+
 # 전략 설정 생성기
 @st.composite
 def strategy_config(draw):
@@ -42,7 +54,7 @@ def market_conditions(draw):
         volume_ratio=draw(st.floats(min_value=0.1, max_value=10.0)),
         rsi=draw(st.floats(min_value=0.0, max_value=100.0)),
         price_change_1m=draw(st.floats(min_value=-10.0, max_value=10.0)),
-        market_trend=draw(st.sampled_from(['bullish', 'bearish', 'neutral'])),
+        market_trend=draw(_MARKET_TRENDS),
         is_rapid_decline=draw(st.booleans())
     )
 
@@ -59,11 +71,8 @@ def position_entry(draw):
         price=price,
         quantity=quantity,
         cost=cost,
-        order_type=draw(st.sampled_from(['initial', 'averaging'])),
-        timestamp=draw(st.datetimes(
-            min_value=datetime(2020, 1, 1),
-            max_value=datetime(2030, 12, 31)
-        ))
+        order_type=draw(_ORDER_TYPES),
+        timestamp=draw(_TIMESTAMPS)
     )
 
 
@@ -82,7 +91,7 @@ def stop_loss_position(draw):
     updated_at = max(entry.timestamp for entry in entries)
     
     return StopLossPosition(
-        market=draw(st.text(min_size=1, max_size=20, alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd')))),
+        market=draw(_MARKET_TEXT),
         entries=entries,
         average_price=average_price,
         total_quantity=total_quantity,
@@ -100,13 +109,10 @@ def strategy_state(draw):
     current_position = draw(stop_loss_position()) if has_position else None
     
     is_suspended = draw(st.booleans())
-    suspension_reason = draw(st.text(min_size=1, max_size=100)) if is_suspended else None
+    suspension_reason = draw(_SUSPENSION_REASONS) if is_suspended else None
     
     has_last_trade = draw(st.booleans())
-    last_trade_time = draw(st.datetimes(
-        min_value=datetime(2020, 1, 1),
-        max_value=datetime(2030, 12, 31)
-    )) if has_last_trade else None
+    last_trade_time = draw(_TIMESTAMPS) if has_last_trade else None
     
     return StrategyState(
         current_position=current_position,
@@ -121,6 +127,15 @@ def strategy_state(draw):
 class MockStrategy:
     """테스트용 모의 전략 클래스"""
     
+    # 설정 범위 검증 테이블: (키, 최솟값, 최댓값)
+    _RANGES = (
+        ('stop_loss_level', -5.0, -1.0),
+        ('averaging_trigger', -2.0, -0.5),
+        ('target_profit', 0.2, 2.0),
+        ('monitoring_interval', 5, 60),
+        ('max_averaging_count', 1, 3),
+    )
+    
     def __init__(self, initial_config: Dict[str, Any]):
         self.config = initial_config.copy()
         self.state = StrategyState(
@@ -153,16 +168,11 @@ class MockStrategy:
                 return False
         
         # 설정 범위 검증
-        if not (-5.0 <= self.config['stop_loss_level'] <= -1.0):
-            return False
-        if not (-2.0 <= self.config['averaging_trigger'] <= -0.5):
-            return False
-        if not (0.2 <= self.config['target_profit'] <= 2.0):
-            return False
-        if not (5 <= self.config['monitoring_interval'] <= 60):
-            return False
-        if not (1 <= self.config['max_averaging_count'] <= 3):
-            return False
+        config = self.config
+        for key, low, high in self._RANGES:
+            value = config[key]
+            if value < low or value > high:
+                return False
         
         return True
 
@@ -13,10 +13,43 @@ import sys
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List, Optional
-from hypothesis import given, strategies as st, assume, settings
+from hypothesis import given, strategies as st, settings, HealthCheck
 from hypothesis.strategies import composite
 
-from upbit_trading_bot.logging.logger import LoggerManager, get_logger
+from upbit_trading_bot.logging.logger import LoggerManager
+
+try:
+    from ciso8601 import parse_datetime as _parse_timestamp
+except ImportError:  # ciso8601은 선택 의존성: 없으면 표준 라이브러리 파서 사용
+    _parse_timestamp = datetime.fromisoformat
+
+
+# 생성기에서 반복 사용하는 기본 전략들 (모듈 로드 시 한 번만 생성)
+_COMPONENTS = st.sampled_from([
+    'api_client', 'market_data', 'order_manager', 'risk_manager',
+    'portfolio_manager', 'strategy_manager', 'config_manager'
+])
+_OPERATIONS = st.sampled_from([
+    'place_order', 'cancel_order', 'fetch_balance', 'get_ticker',
+    'evaluate_strategy', 'update_portfolio', 'load_config'
+])
+_MARKETS = st.sampled_from(['KRW-BTC', 'KRW-ETH', 'KRW-ADA', 'KRW-DOT'])
+# ID 문자: '0'~'z' 코드포인트 범위 (숫자, 영문자와 :;<=>?@[\]^_` 포함)
+_ID_CHARS = st.characters(min_codepoint=48, max_codepoint=122)
+# 출력 가능한 ASCII 문자 중 따옴표, 작은따옴표, 백슬래시 제외
+_MESSAGE_CHARS = st.characters(min_codepoint=32, max_codepoint=126, blacklist_characters='"\'\\')
+_MESSAGE_HEAD = st.characters(min_codepoint=33, max_codepoint=126, blacklist_characters='"\'\\')
+_MESSAGE_TAIL = st.text(min_size=9, max_size=99, alphabet=_MESSAGE_CHARS)
+_ORDER_ID_TEXT = st.text(min_size=10, max_size=50, alphabet=_ID_CHARS)
+_USER_ID_TEXT = st.text(min_size=5, max_size=20, alphabet=_ID_CHARS)
+_ID_TEXT = st.text(min_size=8, max_size=32, alphabet=_ID_CHARS)
+_EXCEPTION_TYPES = (
+    ValueError, TypeError, KeyError, AttributeError,
+    ConnectionError, TimeoutError, RuntimeError
+)
+_EXCEPTION_INDEX = st.integers(min_value=0, max_value=len(_EXCEPTION_TYPES) - 1)
+_AMOUNTS = st.floats(min_value=0.001, max_value=1000000.0)
+_PRICES = st.floats(min_value=1.0, max_value=100000000.0)
 
 
 @composite
@@ -25,40 +58,31 @@ def error_context_data(draw):
     context = {}
     
     # 기본 컨텍스트 필드들
-    context['component'] = draw(st.sampled_from([
-        'api_client', 'market_data', 'order_manager', 'risk_manager',
-        'portfolio_manager', 'strategy_manager', 'config_manager'
-    ]))
-    
-    context['operation'] = draw(st.sampled_from([
-        'place_order', 'cancel_order', 'fetch_balance', 'get_ticker',
-        'evaluate_strategy', 'update_portfolio', 'load_config'
-    ]))
+    context['component'] = draw(_COMPONENTS)
+    context['operation'] = draw(_OPERATIONS)
     
     # 선택적 컨텍스트 필드들
     if draw(st.booleans()):
-        context['market'] = draw(st.sampled_from([
-            'KRW-BTC', 'KRW-ETH', 'KRW-ADA', 'KRW-DOT'
-        ]))
+        context['market'] = draw(_MARKETS)
     
     if draw(st.booleans()):
-        context['order_id'] = draw(st.text(min_size=10, max_size=50, alphabet=st.characters(min_codepoint=48, max_codepoint=122)))
+        context['order_id'] = draw(_ORDER_ID_TEXT)
     
     if draw(st.booleans()):
-        context['user_id'] = draw(st.text(min_size=5, max_size=20, alphabet=st.characters(min_codepoint=48, max_codepoint=122)))
+        context['user_id'] = draw(_USER_ID_TEXT)
     
     if draw(st.booleans()):
-        context['amount'] = draw(st.floats(min_value=0.001, max_value=1000000.0))
+        context['amount'] = draw(_AMOUNTS)
     
     if draw(st.booleans()):
-        context['price'] = draw(st.floats(min_value=1.0, max_value=100000000.0))
+        context['price'] = draw(_PRICES)
     
     # 추가 메타데이터
     if draw(st.booleans()):
-        context['request_id'] = draw(st.text(min_size=8, max_size=32, alphabet=st.characters(min_codepoint=48, max_codepoint=122)))
+        context['request_id'] = draw(_ID_TEXT)
     
     if draw(st.booleans()):
-        context['session_id'] = draw(st.text(min_size=8, max_size=32, alphabet=st.characters(min_codepoint=48, max_codepoint=122)))
+        context['session_id'] = draw(_ID_TEXT)
     
     return context
 
@@ -66,25 +90,11 @@ def error_context_data(draw):
 @composite
 def exception_data(draw):
     """테스트용 예외 데이터 생성."""
-    exception_types = [
-        ValueError, TypeError, KeyError, AttributeError,
-        ConnectionError, TimeoutError, RuntimeError
-    ]
-    
-    exception_type = draw(st.sampled_from(exception_types))
+    # 정수 인덱스는 0(ValueError) 방향으로 가장 효율적으로 축소됨
+    exception_type = _EXCEPTION_TYPES[draw(_EXCEPTION_INDEX)]
     # 안전한 ASCII 문자만 사용하여 오류 메시지 생성
-    error_message = draw(st.text(
-        min_size=10, 
-        max_size=100,
-        alphabet=st.characters(min_codepoint=32, max_codepoint=126)  # 출력 가능한 ASCII 문자만
-    ))
-    
-    # 유효한 에러 메시지인지 확인
-    assume(error_message.strip() != "")
-    assume(not error_message.isspace())
-    assume('"' not in error_message)  # 따옴표 제외
-    assume("'" not in error_message)  # 작은따옴표 제외
-    assume('\\' not in error_message)  # 백슬래시 제외
+    # (공백이 아닌 첫 글자로 시작하므로 빈 메시지나 공백뿐인 메시지가 생성되지 않음)
+    error_message = draw(_MESSAGE_HEAD) + draw(_MESSAGE_TAIL)
     
     return exception_type, error_message
 
@@ -96,7 +106,7 @@ class TestErrorLoggingCompleteness:
         context_data=error_context_data(),
         exception_data=exception_data()
     )
-    @settings(max_examples=20, deadline=10000)
+    @settings(max_examples=100, deadline=2000, suppress_health_check=[HealthCheck.too_slow])
     def test_property_22_error_logging_completeness(self, context_data, exception_data):
         """
         **Feature: upbit-trading-bot, Property 22: 오류 로깅 완전성**
@@ -118,9 +128,6 @@ class TestErrorLoggingCompleteness:
                 structured_format=True
             )
             
-            # 테스트용 로거 생성
-            test_logger = logger_manager.get_logger("test_component")
-            
             # 예외 생성 및 발생
             test_exception = exception_type(error_message)
             
@@ -136,13 +143,6 @@ class TestErrorLoggingCompleteness:
             except Exception as caught_exception:
                 # 오류를 컨텍스트와 함께 로깅
                 logger_manager.log_error_with_context(caught_exception, context_data)
-                
-                # 추가로 일반 로거를 통한 오류 로깅도 테스트
-                test_logger.error(
-                    f"Test error in {context_data.get('component', 'unknown')}: {str(caught_exception)}",
-                    extra=context_data,
-                    exc_info=True
-                )
             
             # 로그 파일들이 생성되었는지 확인
             log_files = list(log_dir.glob("*.log"))
@@ -201,9 +201,8 @@ class TestErrorLoggingCompleteness:
             assert len(traceback_lines) > 0, "스택 트레이스가 비어있지 않아야 함"
             
             # 속성 7: 스택 트레이스에 함수 이름들이 포함되어야 함
-            traceback_text = ''.join(traceback_lines)
-            assert 'inner_function' in traceback_text, "스택 트레이스에 'inner_function'이 포함되어야 함"
-            assert 'nested_function' in traceback_text, "스택 트레이스에 'nested_function'이 포함되어야 함"
+            assert any('inner_function' in line for line in traceback_lines), "스택 트레이스에 'inner_function'이 포함되어야 함"
+            assert any('nested_function' in line for line in traceback_lines), "스택 트레이스에 'nested_function'이 포함되어야 함"
             
             # 속성 8: 기본 로그 메타데이터가 포함되어야 함
             required_fields = ['timestamp', 'level', 'logger', 'module', 'function', 'line']
@@ -213,246 +212,229 @@ class TestErrorLoggingCompleteness:
             # 속성 9: 타임스탬프가 유효한 ISO 형식이어야 함
             timestamp_str = latest_error['timestamp']
             try:
-                datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+                # StructuredFormatter는 'Z' 접미사 없이 isoformat()으로 기록함
+                _parse_timestamp(timestamp_str)
             except ValueError:
                 pytest.fail(f"타임스탬프가 유효한 ISO 형식이어야 함: {timestamp_str}")
             
             # 속성 10: 컨텍스트 정보가 포함되어야 함 (요구사항 8.2)
-            # extra 필드 또는 직접 필드로 컨텍스트가 포함되어야 함
-            context_found = False
-            
-            # extra 필드에서 컨텍스트 확인
-            if 'extra' in latest_error:
-                extra_data = latest_error['extra']
-                for key, value in context_data.items():
-                    if key in extra_data and extra_data[key] == value:
-                        context_found = True
-                        break
-            
-            # 직접 필드에서 컨텍스트 확인
-            if not context_found:
-                for key, value in context_data.items():
-                    if key in latest_error and latest_error[key] == value:
-                        context_found = True
-                        break
+            # log_error_with_context는 컨텍스트를 extra['context']에 기록함
+            extra_data = latest_error.get('extra', {})
+            logged_context = extra_data.get('context', {})
+            common_keys = logged_context.keys() & context_data.keys()
+            context_found = any(logged_context[key] == context_data[key] for key in common_keys)
             
             assert context_found, f"컨텍스트 정보가 로그에 포함되어야 함: {context_data}"
             
             # 속성 11: 로그 레벨이 ERROR여야 함
             assert latest_error['level'] == 'ERROR', "오류 로그의 레벨이 'ERROR'여야 함"
     
-    def test_error_logging_with_nested_exceptions(self):
+    def test_error_logging_with_nested_exceptions(self, tmp_path):
         """중첩된 예외에 대한 오류 로깅 테스트."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-            log_dir.mkdir()
-            
-            logger_manager = LoggerManager(
-                log_dir=str(log_dir),
-                log_level="DEBUG",
-                console_output=False,
-                structured_format=True
-            )
-            
-            test_logger = logger_manager.get_logger("test_nested_errors")
-            
-            # 중첩된 예외 생성
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        
+        logger_manager = LoggerManager(
+            log_dir=str(log_dir),
+            log_level="DEBUG",
+            console_output=False,
+            structured_format=True
+        )
+        
+        # 중첩된 예외 생성
+        try:
             try:
-                try:
-                    # 내부 예외
-                    raise ValueError("Inner exception message")
-                except ValueError as inner_ex:
-                    # 외부 예외 (내부 예외를 감싸는)
-                    raise RuntimeError("Outer exception message") from inner_ex
-            except Exception as caught_exception:
-                # 오류 로깅
-                context = {
-                    'component': 'test_component',
-                    'operation': 'nested_exception_test',
-                    'test_case': 'nested_exceptions'
-                }
-                logger_manager.log_error_with_context(caught_exception, context)
-            
-            # 로그 검증
-            error_log_file = log_dir / "errors.log"
-            assert error_log_file.exists()
-            
-            with open(error_log_file, 'r', encoding='utf-8') as f:
-                log_content = f.read()
-                log_entries = [json.loads(line) for line in log_content.strip().split('\n') if line.strip()]
-            
-            error_entries = [entry for entry in log_entries if entry.get('level') == 'ERROR']
-            assert len(error_entries) > 0
-            
-            latest_error = error_entries[-1]
-            
-            # 중첩된 예외 정보 확인
-            assert 'exception' in latest_error
-            exception_info = latest_error['exception']
-            
-            # 외부 예외 정보
-            assert exception_info['type'] == 'RuntimeError'
-            assert 'Outer exception message' in exception_info['message']
-            
-            # 스택 트레이스에 두 예외 모두 포함되어야 함
-            traceback_text = ''.join(exception_info['traceback'])
-            assert 'RuntimeError' in traceback_text
-            assert 'ValueError' in traceback_text
-            assert 'Inner exception message' in traceback_text
-            assert 'Outer exception message' in traceback_text
-    
-    def test_error_logging_without_exception_info(self):
-        """예외 정보 없이 오류 로깅하는 경우 테스트."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-            log_dir.mkdir()
-            
-            logger_manager = LoggerManager(
-                log_dir=str(log_dir),
-                log_level="DEBUG",
-                console_output=False,
-                structured_format=True
-            )
-            
-            test_logger = logger_manager.get_logger("test_no_exception")
-            
-            # 예외 정보 없이 오류 로깅
+                # 내부 예외
+                raise ValueError("Inner exception message")
+            except ValueError as inner_ex:
+                # 외부 예외 (내부 예외를 감싸는)
+                raise RuntimeError("Outer exception message") from inner_ex
+        except Exception as caught_exception:
+            # 오류 로깅
             context = {
-                'component': 'api_client',
-                'operation': 'fetch_data',
-                'error_code': 'NETWORK_ERROR',
-                'retry_count': 3
+                'component': 'test_component',
+                'operation': 'nested_exception_test',
+                'test_case': 'nested_exceptions'
             }
-            
-            test_logger.error("Network connection failed", extra=context)
-            
-            # 로그 검증
-            error_log_file = log_dir / "errors.log"
-            assert error_log_file.exists()
-            
-            with open(error_log_file, 'r', encoding='utf-8') as f:
-                log_content = f.read()
-                log_entries = [json.loads(line) for line in log_content.strip().split('\n') if line.strip()]
-            
-            error_entries = [entry for entry in log_entries if entry.get('level') == 'ERROR']
-            assert len(error_entries) > 0
-            
-            latest_error = error_entries[-1]
-            
-            # 기본 필드들 확인
-            assert latest_error['level'] == 'ERROR'
-            assert 'Network connection failed' in latest_error['message']
-            assert 'timestamp' in latest_error
-            
-            # 컨텍스트 정보 확인
-            assert 'extra' in latest_error
-            extra_data = latest_error['extra']
-            assert extra_data['component'] == 'api_client'
-            assert extra_data['operation'] == 'fetch_data'
-            assert extra_data['error_code'] == 'NETWORK_ERROR'
-            assert extra_data['retry_count'] == 3
-            
-            # 예외 정보는 없어야 함 (exc_info=False이므로)
-            assert 'exception' not in latest_error
-    
-    def test_critical_error_logging(self):
+            logger_manager.log_error_with_context(caught_exception, context)
+        
+        # 로그 검증
+        error_log_file = log_dir / "errors.log"
+        assert error_log_file.exists()
+        
+        with open(error_log_file, 'r', encoding='utf-8') as f:
+            log_content = f.read()
+            log_entries = [json.loads(line) for line in log_content.strip().split('\n') if line.strip()]
+        
+        error_entries = [entry for entry in log_entries if entry.get('level') == 'ERROR']
+        assert len(error_entries) > 0
+        
+        latest_error = error_entries[-1]
+        
+        # 중첩된 예외 정보 확인
+        assert 'exception' in latest_error
+        exception_info = latest_error['exception']
+        
+        # 외부 예외 정보
+        assert exception_info['type'] == 'RuntimeError'
+        assert 'Outer exception message' in exception_info['message']
+        
+        # 스택 트레이스에 두 예외 모두 포함되어야 함
+        traceback_lines = exception_info['traceback']
+        assert any('RuntimeError' in line for line in traceback_lines)
+        assert any('ValueError' in line for line in traceback_lines)
+        assert any('Inner exception message' in line for line in traceback_lines)
+        assert any('Outer exception message' in line for line in traceback_lines)
+
+    def test_error_logging_without_exception_info(self, tmp_path):
+        """예외 정보 없이 오류 로깅하는 경우 테스트."""
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        
+        logger_manager = LoggerManager(
+            log_dir=str(log_dir),
+            log_level="DEBUG",
+            console_output=False,
+            structured_format=True
+        )
+        
+        test_logger = logger_manager.get_logger("test_no_exception")
+        
+        # 예외 정보 없이 오류 로깅
+        context = {
+            'component': 'api_client',
+            'operation': 'fetch_data',
+            'error_code': 'NETWORK_ERROR',
+            'retry_count': 3
+        }
+        
+        test_logger.error("Network connection failed", extra=context)
+        
+        # 로그 검증
+        error_log_file = log_dir / "errors.log"
+        assert error_log_file.exists()
+        
+        with open(error_log_file, 'r', encoding='utf-8') as f:
+            log_content = f.read()
+            log_entries = [json.loads(line) for line in log_content.strip().split('\n') if line.strip()]
+        
+        error_entries = [entry for entry in log_entries if entry.get('level') == 'ERROR']
+        assert len(error_entries) > 0
+        
+        latest_error = error_entries[-1]
+        
+        # 기본 필드들 확인
+        assert latest_error['level'] == 'ERROR'
+        assert 'Network connection failed' in latest_error['message']
+        assert 'timestamp' in latest_error
+        
+        # 컨텍스트 정보 확인
+        assert 'extra' in latest_error
+        extra_data = latest_error['extra']
+        assert extra_data['component'] == 'api_client'
+        assert extra_data['operation'] == 'fetch_data'
+        assert extra_data['error_code'] == 'NETWORK_ERROR'
+        assert extra_data['retry_count'] == 3
+        
+        # 예외 정보는 없어야 함 (exc_info=False이므로)
+        assert 'exception' not in latest_error
+
+    def test_critical_error_logging(self, tmp_path):
         """CRITICAL 레벨 오류 로깅 테스트."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-            log_dir.mkdir()
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        
+        logger_manager = LoggerManager(
+            log_dir=str(log_dir),
+            log_level="DEBUG",
+            console_output=False,
+            structured_format=True
+        )
+        
+        test_logger = logger_manager.get_logger("test_critical")
+        
+        # CRITICAL 오류 생성
+        try:
+            raise SystemError("Critical system failure")
+        except Exception as e:
+            context = {
+                'component': 'system_core',
+                'operation': 'startup',
+                'severity': 'critical',
+                'requires_immediate_attention': True
+            }
             
-            logger_manager = LoggerManager(
-                log_dir=str(log_dir),
-                log_level="DEBUG",
-                console_output=False,
-                structured_format=True
+            test_logger.critical(
+                f"Critical system error: {str(e)}",
+                extra=context,
+                exc_info=True
             )
-            
-            test_logger = logger_manager.get_logger("test_critical")
-            
-            # CRITICAL 오류 생성
-            try:
-                raise SystemError("Critical system failure")
-            except Exception as e:
-                context = {
-                    'component': 'system_core',
-                    'operation': 'startup',
-                    'severity': 'critical',
-                    'requires_immediate_attention': True
-                }
-                
-                test_logger.critical(
-                    f"Critical system error: {str(e)}",
-                    extra=context,
-                    exc_info=True
-                )
-            
-            # 로그 검증
-            error_log_file = log_dir / "errors.log"
-            assert error_log_file.exists()
-            
-            with open(error_log_file, 'r', encoding='utf-8') as f:
-                log_content = f.read()
-                log_entries = [json.loads(line) for line in log_content.strip().split('\n') if line.strip()]
-            
-            critical_entries = [entry for entry in log_entries if entry.get('level') == 'CRITICAL']
-            assert len(critical_entries) > 0, "CRITICAL 레벨 로그 엔트리가 있어야 함"
-            
-            latest_critical = critical_entries[-1]
-            
-            # CRITICAL 레벨 확인
-            assert latest_critical['level'] == 'CRITICAL'
-            assert 'Critical system failure' in latest_critical['message']
-            
-            # 예외 정보 확인
-            assert 'exception' in latest_critical
-            exception_info = latest_critical['exception']
-            assert exception_info['type'] == 'SystemError'
-            assert exception_info['message'] == 'Critical system failure'
-            
-            # 컨텍스트 정보 확인
-            assert 'extra' in latest_critical
-            extra_data = latest_critical['extra']
-            assert extra_data['severity'] == 'critical'
-            assert extra_data['requires_immediate_attention'] is True
-    
-    def test_log_file_creation_and_structure(self):
+        
+        # 로그 검증
+        error_log_file = log_dir / "errors.log"
+        assert error_log_file.exists()
+        
+        with open(error_log_file, 'r', encoding='utf-8') as f:
+            log_content = f.read()
+            log_entries = [json.loads(line) for line in log_content.strip().split('\n') if line.strip()]
+        
+        critical_entries = [entry for entry in log_entries if entry.get('level') == 'CRITICAL']
+        assert len(critical_entries) > 0, "CRITICAL 레벨 로그 엔트리가 있어야 함"
+        
+        latest_critical = critical_entries[-1]
+        
+        # CRITICAL 레벨 확인
+        assert latest_critical['level'] == 'CRITICAL'
+        assert 'Critical system failure' in latest_critical['message']
+        
+        # 예외 정보 확인
+        assert 'exception' in latest_critical
+        exception_info = latest_critical['exception']
+        assert exception_info['type'] == 'SystemError'
+        assert exception_info['message'] == 'Critical system failure'
+        
+        # 컨텍스트 정보 확인
+        assert 'extra' in latest_critical
+        extra_data = latest_critical['extra']
+        assert extra_data['severity'] == 'critical'
+        assert extra_data['requires_immediate_attention'] is True
+
+    def test_log_file_creation_and_structure(self, tmp_path):
         """로그 파일 생성 및 구조 테스트."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-            log_dir.mkdir()
-            
-            logger_manager = LoggerManager(
-                log_dir=str(log_dir),
-                log_level="INFO",
-                console_output=False,
-                structured_format=True
-            )
-            
-            test_logger = logger_manager.get_logger("test_structure")
-            
-            # 다양한 레벨의 로그 생성
-            test_logger.info("Info message")
-            test_logger.warning("Warning message")
-            test_logger.error("Error message")
-            
-            # 로그 파일들이 생성되었는지 확인
-            main_log_file = log_dir / "trading_bot.log"
-            error_log_file = log_dir / "errors.log"
-            
-            assert main_log_file.exists(), "메인 로그 파일이 생성되어야 함"
-            assert error_log_file.exists(), "에러 로그 파일이 생성되어야 함"
-            
-            # 메인 로그 파일에는 모든 레벨의 로그가 있어야 함
-            with open(main_log_file, 'r', encoding='utf-8') as f:
-                main_content = f.read()
-                assert 'Info message' in main_content
-                assert 'Warning message' in main_content
-                assert 'Error message' in main_content
-            
-            # 에러 로그 파일에는 ERROR 레벨만 있어야 함
-            with open(error_log_file, 'r', encoding='utf-8') as f:
-                error_content = f.read()
-                assert 'Error message' in error_content
-                assert 'Info message' not in error_content
-                assert 'Warning message' not in error_content
\ No newline at end of file
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        
+        logger_manager = LoggerManager(
+            log_dir=str(log_dir),
+            log_level="INFO",
+            console_output=False,
+            structured_format=True
+        )
+        
+        test_logger = logger_manager.get_logger("test_structure")
+        
+        # 다양한 레벨의 로그 생성
+        test_logger.info("Info message")
+        test_logger.warning("Warning message")
+        test_logger.error("Error message")
+        
+        # 로그 파일들이 생성되었는지 확인
+        main_log_file = log_dir / "trading_bot.log"
+        error_log_file = log_dir / "errors.log"
+        
+        assert main_log_file.exists(), "메인 로그 파일이 생성되어야 함"
+        assert error_log_file.exists(), "에러 로그 파일이 생성되어야 함"
+        
+        # 메인 로그 파일에는 모든 레벨의 로그가 있어야 함
+        with open(main_log_file, 'r', encoding='utf-8') as f:
+            main_content = f.read()
+            assert 'Info message' in main_content
+            assert 'Warning message' in main_content
+            assert 'Error message' in main_content
+        
+        # 에러 로그 파일에는 ERROR 레벨만 있어야 함
+        with open(error_log_file, 'r', encoding='utf-8') as f:
+            error_content = f.read()
+            assert 'Error message' in error_content
+            assert 'Info message' not in error_content
+            assert 'Warning message' not in error_content
\ No newline at end of file
@@ -8,16 +8,53 @@ Tests that when generating sell signals, the strategy includes Upbit fees (0.05%
 in profit calculations.
 """
 
+import numpy as np
 import pytest
-from hypothesis import given, strategies as st, assume, settings, HealthCheck
+from hypothesis import given, strategies as st, assume, settings, target
+from hypothesis.extra.numpy import arrays
 from datetime import datetime, timedelta
 from decimal import Decimal
+from types import MappingProxyType
 
 from upbit_trading_bot.strategy.stop_loss_averaging import StopLossAveragingStrategy
 from upbit_trading_bot.strategy.base import MarketData
 from upbit_trading_bot.data.models import Ticker, StopLossAveragingSignal
 
 
+# Analyzer/risk settings are never varied, so they are shared read-only across examples
+_FIXED_ANALYZER = MappingProxyType({
+    'volatility_threshold': 5.0,
+    'volume_ratio_threshold': 1.5,
+    'rapid_decline_threshold': -2.0,
+    'rsi_oversold_threshold': 30,
+    'market_decline_threshold': -3.0
+})
+_FIXED_RISK = MappingProxyType({
+    'daily_loss_limit': 10000.0,
+    'consecutive_loss_limit': 3,
+    'min_balance_threshold': 5000.0
+})
+
+
+# Configuration used to build the strategy shared across Hypothesis examples
+_BASE_CONFIG = {
+    'parameters': {
+        'stop_loss_level': -3.0,
+        'averaging_trigger': -1.0,
+        'target_profit': 0.5,
+        'max_averaging_count': 1,
+        'trading_fee': 0.0005,
+        'monitoring_interval': 10,
+        'market_analyzer': _FIXED_ANALYZER,
+        'risk_controller': _FIXED_RISK
+    }
+}
+
+
+# Minimum history the strategy demands, read once from a probe instance
+_REQUIRED_HISTORY = StopLossAveragingStrategy("probe", _BASE_CONFIG).get_required_history_length()
+
+
 # Test data generators
 @st.composite
 def generate_market_data(draw):
@@ -28,33 +65,31 @@ def generate_market_data(draw):
     base_price = draw(st.floats(min_value=1000, max_value=100000, allow_nan=False, allow_infinity=False))
     
     # Generate price history with realistic variations
-    history_length = draw(st.integers(min_value=50, max_value=100))
-    price_history = []
-    current_price = base_price
+    history_length = draw(st.integers(min_value=_REQUIRED_HISTORY, max_value=100))
     
-    for _ in range(history_length):
-        # Small random variations (-2% to +2%)
-        variation = draw(st.floats(min_value=-0.02, max_value=0.02, allow_nan=False, allow_infinity=False))
-        current_price = current_price * (1 + variation)
-        current_price = max(current_price, 100)  # Minimum price
-        price_history.append(current_price)
+    # Small random variations (-2% to +2%) compounded in a single vectorized pass
+    variations = draw(arrays(
+        np.float64, history_length,
+        elements=st.floats(min_value=-0.02, max_value=0.02, allow_nan=False, allow_infinity=False)
+    ))
+    price_history = np.maximum(base_price * np.cumprod(1 + variations), 100).tolist()  # Minimum price
     
     # Generate volume data
-    volume_history = [
-        draw(st.floats(min_value=1000, max_value=1000000, allow_nan=False, allow_infinity=False))
-        for _ in range(history_length)
-    ]
+    volume_history = draw(arrays(
+        np.float64, history_length,
+        elements=st.floats(min_value=1000, max_value=1000000, allow_nan=False, allow_infinity=False)
+    )).tolist()
     
-    # Generate timestamps
+    # Generate timestamps (only their count is inspected, so a datetime64 range suffices)
     base_time = datetime.now() - timedelta(minutes=history_length)
-    timestamps = [base_time + timedelta(minutes=i) for i in range(history_length)]
+    timestamps = np.datetime64(base_time, 'm') + np.arange(history_length).astype('timedelta64[m]')
     
     # Create current ticker
     current_ticker = Ticker(
         market=market,
         trade_price=price_history[-1],
         trade_volume=volume_history[-1],
-        timestamp=timestamps[-1],
+        timestamp=base_time + timedelta(minutes=history_length - 1),
         change_rate=draw(st.floats(min_value=-0.1, max_value=0.1, allow_nan=False, allow_infinity=False))
     )
     
@@ -81,22 +116,73 @@ def generate_strategy_config(draw):
             'max_averaging_count': draw(st.integers(min_value=1, max_value=3)),
             'trading_fee': 0.0005,  # Fixed Upbit fee (0.05%)
             'monitoring_interval': draw(st.integers(min_value=5, max_value=60)),
-            'market_analyzer': {
-                'volatility_threshold': 5.0,
-                'volume_ratio_threshold': 1.5,
-                'rapid_decline_threshold': -2.0,
-                'rsi_oversold_threshold': 30,
-                'market_decline_threshold': -3.0
-            },
-            'risk_controller': {
-                'daily_loss_limit': 10000.0,
-                'consecutive_loss_limit': 3,
-                'min_balance_threshold': 5000.0
-            }
+            'market_analyzer': _FIXED_ANALYZER,
+            'risk_controller': _FIXED_RISK
         }
     }
 
 
+def _reset_strategy(strategy, config):
+    """Reset the shared strategy and apply the parameters Hypothesis varies."""
+    params = config['parameters']
+    strategy.stop_loss_level = params['stop_loss_level']
+    strategy.averaging_trigger = params['averaging_trigger']
+    strategy.target_profit = params['target_profit']
+    strategy.max_averaging_count = params['max_averaging_count']
+    strategy.trading_fee = params['trading_fee']
+    strategy.monitoring_interval = params['monitoring_interval']
+    
+    # Clear per-example state left behind by the previous example
+    strategy.position_manager.clear_all_positions()
+    strategy.partial_sell_manager.target_profit = strategy.target_profit
+    strategy.partial_sell_manager.reset()
+    strategy.trailing_stop_manager.activation_profit = strategy.target_profit * 1.5
+    strategy.trailing_stop_manager.reset()
+    strategy.strategy_state.is_suspended = False
+    strategy.strategy_state.suspension_reason = None
+    
+    return strategy
+
+
+def _target_breakeven(pnl_info):
+    """Steer Hypothesis towards exits near the fee-inclusive breakeven point."""
+    if pnl_info:
+        target(-abs(pnl_info['pnl_rate']), label='pnl_rate_distance_from_breakeven')
+
+
+def _expected_pnl(prices, position, fee):
+    """Reference fee-inclusive PnL at several exit prices, computed in one vectorized pass."""
+    current_values = np.asarray(prices) * position.total_quantity
+    buy_fees = position.total_cost * fee
+    sell_fees = current_values * fee
+    return current_values - position.total_cost - buy_fees - sell_fees
+
+
+def _extend_market_data(market_data, new_price):
+    """Return a copy of market_data with new_price appended as the latest tick."""
+    ticker = market_data.current_ticker
+    last_price = market_data.price_history[-1]
+    now = datetime.now()
+    return MarketData(
+        current_ticker=Ticker(
+            market=ticker.market,
+            trade_price=new_price,
+            trade_volume=ticker.trade_volume,
+            timestamp=now,
+            change_rate=(new_price - last_price) / last_price
+        ),
+        price_history=[*market_data.price_history, new_price],
+        volume_history=[*market_data.volume_history, ticker.trade_volume],
+        timestamps=np.append(market_data.timestamps, np.datetime64(now, 'm'))
+    )
+
+
+@pytest.fixture(scope="class")
+def strategy_pool():
+    """Single strategy instance shared across Hypothesis examples."""
+    return StopLossAveragingStrategy("test_strategy", _BASE_CONFIG)
+
+
 class TestFeeInclusiveProfitCalculation:
     """Property-based tests for fee-inclusive profit calculation."""
     
@@ -104,8 +190,8 @@ class TestFeeInclusiveProfitCalculation:
         market_data=generate_market_data(),
         config=generate_strategy_config()
     )
-    @settings(max_examples=100, deadline=5000, suppress_health_check=[HealthCheck.filter_too_much])
-    def test_fee_inclusive_profit_calculation_property(self, market_data, config):
+    @settings(max_examples=40, deadline=5000)
+    def test_fee_inclusive_profit_calculation_property(self, strategy_pool, market_data, config):
         """
         **Feature: stop-loss-averaging-strategy, Property 6: 수수료 포함 손익 계산**
         **Validates: Requirements 2.1**
@@ -114,11 +200,7 @@ class TestFeeInclusiveProfitCalculation:
         in profit calculations.
         """
         # Arrange
-        strategy = StopLossAveragingStrategy("test_strategy", config)
-        
-        # Ensure market data is valid
-        assume(market_data.validate())
-        assume(len(market_data.price_history) >= strategy.get_required_history_length())
+        strategy = _reset_strategy(strategy_pool, config)
         
         # Verify trading fee is set to Upbit's fee
         assert strategy.trading_fee == 0.0005, "Trading fee should be set to Upbit's 0.05%"
@@ -146,65 +228,83 @@ class TestFeeInclusiveProfitCalculation:
         assume(profitable_price > initial_price * 1.005)  # At least 0.5% profit
         
         # Create market data with profitable price
-        profitable_market_data = MarketData(
-            current_ticker=Ticker(
-                market=market_data.current_ticker.market,
-                trade_price=profitable_price,
-                trade_volume=market_data.current_ticker.trade_volume,
-                timestamp=datetime.now(),
-                change_rate=(profitable_price - initial_price) / initial_price
-            ),
-            price_history=market_data.price_history + [profitable_price],
-            volume_history=market_data.volume_history + [market_data.current_ticker.trade_volume],
-            timestamps=market_data.timestamps + [datetime.now()]
-        )
+        profitable_market_data = _extend_market_data(market_data, profitable_price)
         
         # Act
         signal = strategy.evaluate(profitable_market_data)
         
-        # Assert
-        if signal is not None and signal.action == 'sell':
-            # Verify that the signal includes fee calculations
-            assert isinstance(signal, StopLossAveragingSignal)
+        # Assert (only sell signals exercise the fee-inclusive expected PnL)
+        assume(signal is not None and signal.action == 'sell')
+        
+        # Verify that the signal includes fee calculations
+        assert isinstance(signal, StopLossAveragingSignal)
+        
+        # Check that expected PnL is calculated with fees
+        if signal.expected_pnl is not None:
+            # Get the actual PnL info from the strategy
+            pnl_info = strategy._calculate_position_pnl(profitable_price, position)
+            _target_breakeven(pnl_info)
             
-            # Check that expected PnL is calculated with fees
-            if signal.expected_pnl is not None:
-                # Get the actual PnL info from the strategy
-                pnl_info = strategy._calculate_position_pnl(profitable_price, position)
+            # For partial sell signals, the expected PnL should be proportional to the sell ratio
+            if signal.signal_reason == 'partial_sell':
+                # The strategy calculates expected_pnl as pnl_info['pnl'] * sell_ratio
+                # We need to verify that this calculation includes fees
+                
+                # Verify that the PnL calculation itself includes fees
+                current_value = profitable_price * position.total_quantity
+                buy_fees = position.total_cost * strategy.trading_fee
+                sell_fees = current_value * strategy.trading_fee
+                expected_full_pnl = current_value - position.total_cost - buy_fees - sell_fees
+                
+                # Allow for small floating point differences in the full PnL calculation
+                assert abs(pnl_info['pnl'] - expected_full_pnl) < 0.01, \
+                    f"Full PnL calculation should include fees. Expected: {expected_full_pnl}, Got: {pnl_info['pnl']}"
+                
+                # The signal's expected_pnl should be a fraction of the full PnL
+                # (The exact fraction depends on the partial sell manager's logic)
+                assert 0 < signal.expected_pnl <= pnl_info['pnl'], \
+                    f"Partial sell expected PnL should be a positive fraction of full PnL. Full: {pnl_info['pnl']}, Partial: {signal.expected_pnl}"
                 
-                # For partial sell signals, the expected PnL should be proportional to the sell ratio
-                if signal.signal_reason == 'partial_sell':
-                    # The strategy calculates expected_pnl as pnl_info['pnl'] * sell_ratio
-                    # We need to verify that this calculation includes fees
-                    
-                    # Verify that the PnL calculation itself includes fees
-                    current_value = profitable_price * position.total_quantity
-                    buy_fees = position.total_cost * strategy.trading_fee
-                    sell_fees = current_value * strategy.trading_fee
-                    expected_full_pnl = current_value - position.total_cost - buy_fees - sell_fees
-                    
-                    # Allow for small floating point differences in the full PnL calculation
-                    assert abs(pnl_info['pnl'] - expected_full_pnl) < 0.01, \
-                        f"Full PnL calculation should include fees. Expected: {expected_full_pnl}, Got: {pnl_info['pnl']}"
-                    
-                    # The signal's expected_pnl should be a fraction of the full PnL
-                    # (The exact fraction depends on the partial sell manager's logic)
-                    assert 0 < signal.expected_pnl <= pnl_info['pnl'], \
-                        f"Partial sell expected PnL should be a positive fraction of full PnL. Full: {pnl_info['pnl']}, Partial: {signal.expected_pnl}"
-                    
-                else:
-                    # For full sell signals, calculate full expected PnL with fees
-                    current_value = profitable_price * position.total_quantity
-                    buy_fees = position.total_cost * strategy.trading_fee
-                    sell_fees = current_value * strategy.trading_fee
-                    expected_net_pnl = current_value - position.total_cost - buy_fees - sell_fees
-                    
-                    # Allow for small floating point differences
-                    assert abs(signal.expected_pnl - expected_net_pnl) < 0.01, \
-                        f"Signal's expected PnL should include fees. Expected: {expected_net_pnl}, Got: {signal.expected_pnl}"
-        
-        # Additional verification: Check strategy's internal PnL calculation
+            else:
+                # For full sell signals, calculate full expected PnL with fees
+                current_value = profitable_price * position.total_quantity
+                buy_fees = position.total_cost * strategy.trading_fee
+                sell_fees = current_value * strategy.trading_fee
+                expected_net_pnl = current_value - position.total_cost - buy_fees - sell_fees
+                
+                # Allow for small floating point differences
+                assert abs(signal.expected_pnl - expected_net_pnl) < 0.01, \
+                    f"Signal's expected PnL should include fees. Expected: {expected_net_pnl}, Got: {signal.expected_pnl}"
+    
+    @given(
+        market_data=generate_market_data(),
+        config=generate_strategy_config()
+    )
+    @settings(max_examples=40, deadline=5000)
+    def test_position_pnl_includes_buy_and_sell_fees(self, strategy_pool, market_data, config):
+        """
+        Test that the strategy's internal PnL calculation deducts both buy and sell fees.
+        """
+        # Arrange
+        strategy = _reset_strategy(strategy_pool, config)
+        
+        initial_price = market_data.price_history[-1]
+        strategy.position_manager.add_initial_position(
+            market_data.current_ticker.market,
+            initial_price,
+            0.1
+        )
+        
+        position = strategy.position_manager.get_position(market_data.current_ticker.market)
+        assume(position is not None)
+        
+        profitable_price = initial_price * (1 + (strategy.target_profit + 0.2) / 100)
+        
+        # Act
         pnl_info = strategy._calculate_position_pnl(profitable_price, position)
+        _target_breakeven(pnl_info)
+        
+        # Assert
         if pnl_info:
             # Verify that buy fees are calculated correctly
             expected_buy_fees = position.total_cost * strategy.trading_fee
@@ -226,17 +326,18 @@ class TestFeeInclusiveProfitCalculation:
         market_data=generate_market_data(),
         config=generate_strategy_config()
     )
-    @settings(max_examples=50, deadline=5000, suppress_health_check=[HealthCheck.filter_too_much])
-    def test_upbit_fee_rate_consistency(self, market_data, config):
+    @settings(max_examples=20, deadline=5000)
+    @pytest.mark.parametrize("price_mult", [
+        0.97,  # Loss scenario
+        1.0,   # Breakeven scenario
+        1.02   # Profit scenario
+    ])
+    def test_upbit_fee_rate_consistency(self, strategy_pool, price_mult, market_data, config):
         """
         Test that the strategy consistently uses Upbit's fee rate (0.05%).
         """
         # Arrange
-        strategy = StopLossAveragingStrategy("test_strategy", config)
-        
-        # Ensure market data is valid
-        assume(market_data.validate())
-        assume(len(market_data.price_history) >= strategy.get_required_history_length())
+        strategy = _reset_strategy(strategy_pool, config)
         
         # Assert that trading fee is exactly Upbit's rate
         assert strategy.trading_fee == 0.0005, \
@@ -255,43 +356,33 @@ class TestFeeInclusiveProfitCalculation:
         position = strategy.position_manager.get_position(market_data.current_ticker.market)
         assume(position is not None)
         
-        # Test fee calculation at different price levels
-        test_prices = [
-            initial_price * 0.97,  # Loss scenario
-            initial_price * 1.0,   # Breakeven scenario
-            initial_price * 1.02   # Profit scenario
-        ]
+        # Test fee calculation at the parametrized price level
+        test_price = initial_price * price_mult
+        pnl_info = strategy._calculate_position_pnl(test_price, position)
+        _target_breakeven(pnl_info)
         
-        for test_price in test_prices:
-            pnl_info = strategy._calculate_position_pnl(test_price, position)
+        if pnl_info:
+            # Verify buy fee calculation
+            expected_buy_fee = position.total_cost * 0.0005
+            assert abs(pnl_info['buy_fees'] - expected_buy_fee) < 0.01, \
+                f"Buy fee should be 0.05% of cost at price {test_price}"
             
-            if pnl_info:
-                # Verify buy fee calculation
-                expected_buy_fee = position.total_cost * 0.0005
-                assert abs(pnl_info['buy_fees'] - expected_buy_fee) < 0.01, \
-                    f"Buy fee should be 0.05% of cost at price {test_price}"
-                
-                # Verify sell fee calculation
-                current_value = test_price * position.total_quantity
-                expected_sell_fee = current_value * 0.0005
-                assert abs(pnl_info['sell_fees'] - expected_sell_fee) < 0.01, \
-                    f"Sell fee should be 0.05% of value at price {test_price}"
+            # Verify sell fee calculation
+            expected_sell_fee = test_price * position.total_quantity * 0.0005
+            assert abs(pnl_info['sell_fees'] - expected_sell_fee) < 0.01, \
+                f"Sell fee should be 0.05% of value at price {test_price}"
     
     @given(
         market_data=generate_market_data(),
         config=generate_strategy_config()
     )
-    @settings(max_examples=50, deadline=5000, suppress_health_check=[HealthCheck.filter_too_much])
-    def test_fee_impact_on_breakeven_calculation(self, market_data, config):
+    @settings(max_examples=40, deadline=5000)
+    def test_fee_impact_on_breakeven_calculation(self, strategy_pool, market_data, config):
         """
         Test that fees are properly considered in breakeven calculations.
         """
         # Arrange
-        strategy = StopLossAveragingStrategy("test_strategy", config)
-        
-        # Ensure market data is valid
-        assume(market_data.validate())
-        assume(len(market_data.price_history) >= strategy.get_required_history_length())
+        strategy = _reset_strategy(strategy_pool, config)
         
         # Create position
         initial_price = market_data.price_history[-1]
@@ -315,51 +406,39 @@ class TestFeeInclusiveProfitCalculation:
         target_with_fees = strategy.target_profit + breakeven_with_fees
         breakeven_with_fees_price = initial_price * (1 + target_with_fees / 100)
         
-        # Test PnL calculation at both prices
-        pnl_without_fees = strategy._calculate_position_pnl(breakeven_without_fees, position)
-        pnl_with_fees = strategy._calculate_position_pnl(breakeven_with_fees_price, position)
-        
-        if pnl_without_fees and pnl_with_fees:
-            # At breakeven without fees, net PnL should be less than at breakeven with fees
-            # (The exact sign depends on the target profit vs fee relationship)
-            assert pnl_without_fees['pnl'] < pnl_with_fees['pnl'], \
-                "PnL should be lower at breakeven price without fees compared to fee-adjusted breakeven"
-            
-            # At breakeven with fees, net PnL should be approximately zero or positive
-            assert pnl_with_fees['pnl'] >= -0.01, \
-                "PnL should be approximately zero or positive at fee-adjusted breakeven price"
-            
-            # The difference should reflect the additional profit needed to cover fees
-            price_difference = breakeven_with_fees_price - breakeven_without_fees
-            expected_additional_profit = price_difference * position.total_quantity
-            pnl_difference = pnl_with_fees['pnl'] - pnl_without_fees['pnl']
-            
-            # The PnL difference should be close to the additional profit (allowing for fee calculations)
-            # Since fees are calculated on both buy and sell, the relationship is more complex
-            total_fees_at_higher_price = pnl_with_fees['buy_fees'] + pnl_with_fees['sell_fees']
-            total_fees_at_lower_price = pnl_without_fees['buy_fees'] + pnl_without_fees['sell_fees']
-            fee_difference = total_fees_at_higher_price - total_fees_at_lower_price
-            
-            # The net effect should account for both additional profit and additional fees
-            expected_net_difference = expected_additional_profit - fee_difference
-            assert abs(pnl_difference - expected_net_difference) < 0.1, \
-                f"PnL difference should reflect additional profit minus additional fees. Expected: {expected_net_difference}, Got: {pnl_difference}"
+        # Strategy PnL at both prices
+        pnl_info_without_fees = strategy._calculate_position_pnl(breakeven_without_fees, position)
+        pnl_info_with_fees = strategy._calculate_position_pnl(breakeven_with_fees_price, position)
+        assert pnl_info_without_fees is not None and pnl_info_with_fees is not None
+        _target_breakeven(pnl_info_with_fees)
+        pnl_without_fees = pnl_info_without_fees['pnl']
+        pnl_with_fees = pnl_info_with_fees['pnl']
+        
+        # Cross-validate both strategy results against the fee-inclusive formula
+        expected_pnl = _expected_pnl([breakeven_without_fees, breakeven_with_fees_price], position, trading_fee)
+        assert np.allclose([pnl_without_fees, pnl_with_fees], expected_pnl, rtol=0, atol=0.01), \
+            f"Strategy PnL should match fee-inclusive calculation. Expected: {expected_pnl}, Got: {[pnl_without_fees, pnl_with_fees]}"
+        
+        # At breakeven without fees, net PnL should be less than at breakeven with fees
+        # (The exact sign depends on the target profit vs fee relationship)
+        assert pnl_without_fees < pnl_with_fees, \
+            "PnL should be lower at breakeven price without fees compared to fee-adjusted breakeven"
+        
+        # At breakeven with fees, net PnL should be approximately zero or positive
+        assert pnl_with_fees >= -0.01, \
+            "PnL should be approximately zero or positive at fee-adjusted breakeven price"
     
     @given(
         market_data=generate_market_data(),
         config=generate_strategy_config()
     )
-    @settings(max_examples=50, deadline=5000, suppress_health_check=[HealthCheck.filter_too_much])
-    def test_sell_signal_generation_includes_fees(self, market_data, config):
+    @settings(max_examples=40, deadline=5000)
+    def test_sell_signal_generation_includes_fees(self, strategy_pool, market_data, config):
         """
         Test that sell signal generation properly considers fees.
         """
         # Arrange
-        strategy = StopLossAveragingStrategy("test_strategy", config)
-        
-        # Ensure market data is valid
-        assume(market_data.validate())
-        assume(len(market_data.price_history) >= strategy.get_required_history_length())
+        strategy = _reset_strategy(strategy_pool, config)
         
         # Create position
         initial_price = market_data.price_history[-1]
@@ -379,18 +458,7 @@ class TestFeeInclusiveProfitCalculation:
         profit_without_fees = strategy.target_profit / 2  # Half the target profit
         price_without_fee_consideration = initial_price * (1 + profit_without_fees / 100)
         
-        market_data_without_fees = MarketData(
-            current_ticker=Ticker(
-                market=market_data.current_ticker.market,
-                trade_price=price_without_fee_consideration,
-                trade_volume=market_data.current_ticker.trade_volume,
-                timestamp=datetime.now(),
-                change_rate=profit_without_fees / 100
-            ),
-            price_history=market_data.price_history + [price_without_fee_consideration],
-            volume_history=market_data.volume_history + [market_data.current_ticker.trade_volume],
-            timestamps=market_data.timestamps + [datetime.now()]
-        )
+        market_data_without_fees = _extend_market_data(market_data, price_without_fee_consideration)
         
         # Act
         signal_without_fees = strategy.evaluate(market_data_without_fees)
@@ -408,18 +476,7 @@ class TestFeeInclusiveProfitCalculation:
         target_with_fees = strategy.target_profit + breakeven_with_fees + 0.1  # Add small buffer
         price_with_fee_consideration = initial_price * (1 + target_with_fees / 100)
         
-        market_data_with_fees = MarketData(
-            current_ticker=Ticker(
-                market=market_data.current_ticker.market,
-                trade_price=price_with_fee_consideration,
-                trade_volume=market_data.current_ticker.trade_volume,
-                timestamp=datetime.now(),
-                change_rate=target_with_fees / 100
-            ),
-            price_history=market_data.price_history + [price_with_fee_consideration],
-            volume_history=market_data.volume_history + [market_data.current_ticker.trade_volume],
-            timestamps=market_data.timestamps + [datetime.now()]
-        )
+        market_data_with_fees = _extend_market_data(market_data, price_with_fee_consideration)
         
         signal_with_fees = strategy.evaluate(market_data_with_fees)
         
@@ -427,6 +484,7 @@ class TestFeeInclusiveProfitCalculation:
         if signal_with_fees is not None:
             # If a signal is generated, verify it accounts for fees
             pnl_info = strategy._calculate_position_pnl(price_with_fee_consideration, position)
+            _target_breakeven(pnl_info)
             if pnl_info:
                 # Net PnL should be positive after fees
                 assert pnl_info['pnl'] > 0, \
@@ -442,17 +500,13 @@ class TestFeeInclusiveProfitCalculation:
         market_data=generate_market_data(),
         config=generate_strategy_config()
     )
-    @settings(max_examples=30, deadline=5000, suppress_health_check=[HealthCheck.filter_too_much])
-    def test_fee_calculation_with_averaging_position(self, market_data, config):
+    @settings(max_examples=30, deadline=5000)
+    def test_fee_calculation_with_averaging_position(self, strategy_pool, market_data, config):
         """
         Test that fees are correctly calculated for positions with averaging entries.
         """
         # Arrange
-        strategy = StopLossAveragingStrategy("test_strategy", config)
-        
-        # Ensure market data is valid
-        assume(market_data.validate())
-        assume(len(market_data.price_history) >= strategy.get_required_history_length())
+        strategy = _reset_strategy(strategy_pool, config)
         
         # Create initial position
         initial_price = market_data.price_history[-1]
@@ -480,6 +534,7 @@ class TestFeeInclusiveProfitCalculation:
         test_price = position_with_averaging.average_price * 1.02  # 2% above average
         
         pnl_info = strategy._calculate_position_pnl(test_price, position_with_averaging)
+        _target_breakeven(pnl_info)
         
         if pnl_info:
             # Buy fees should be calculated on total cost (both entries)
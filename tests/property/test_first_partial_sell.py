@@ -5,163 +5,93 @@ Tests Property 37: 첫 번째 부분 매도
 Validates Requirements 9.1
 """
 
-import pytest
-from hypothesis import given, strategies as st, assume
+import functools
+
+from hypothesis import settings, strategies as st
+from hypothesis.stateful import RuleBasedStateMachine, initialize, invariant, rule
 from upbit_trading_bot.strategy.partial_sell_manager import PartialSellManager
 
 
-class TestFirstPartialSell:
-    """첫 번째 부분 매도 속성 테스트"""
-    
-    @given(
-        target_profit=st.floats(min_value=0.2, max_value=5.0, allow_nan=False, allow_infinity=False),
-        total_quantity=st.floats(min_value=0.001, max_value=1000.0, allow_nan=False, allow_infinity=False)
-    )
-    def test_first_partial_sell_at_50_percent_target(self, target_profit, total_quantity):
-        """
-        **Feature: stop-loss-averaging-strategy, Property 37: 첫 번째 부분 매도**
-        
-        모든 포지션에서, 목표 수익률의 50% 도달 시 포지션의 30%가 부분 매도되어야 한다
-        **검증: 요구사항 9.1**
-        """
-        # Given: 부분 매도 관리자 생성
-        manager = PartialSellManager(target_profit)
-        
-        # When: 목표 수익률의 50%에 도달
-        current_pnl = target_profit * 0.5
-        sell_ratio = manager.should_partial_sell(current_pnl)
-        
-        # Then: 30% 매도 비율이 반환되어야 함
-        assert sell_ratio is not None
-        assert abs(sell_ratio - 0.3) < 0.001
-        
-        # And: 매도 수량이 정확히 계산되어야 함
-        sell_quantity = manager.calculate_sell_quantity(total_quantity, sell_ratio)
-        expected_quantity = total_quantity * 0.3
-        assert abs(sell_quantity - expected_quantity) < 0.000001
-    
-    @given(
-        target_profit=st.floats(min_value=0.2, max_value=5.0, allow_nan=False, allow_infinity=False),
-        total_quantity=st.floats(min_value=0.001, max_value=1000.0, allow_nan=False, allow_infinity=False),
-        pnl_ratio=st.floats(min_value=0.49, max_value=0.499, allow_nan=False, allow_infinity=False)
-    )
-    def test_no_partial_sell_below_50_percent_threshold(self, target_profit, total_quantity, pnl_ratio):
-        """
-        **Feature: stop-loss-averaging-strategy, Property 37: 첫 번째 부분 매도**
-        
-        목표 수익률의 50% 미만에서는 첫 번째 부분 매도가 발생하지 않아야 한다
-        **검증: 요구사항 9.1**
-        """
-        # Given: 부분 매도 관리자 생성
-        manager = PartialSellManager(target_profit)
-        
-        # When: 목표 수익률의 50% 미만에 도달
-        current_pnl = target_profit * pnl_ratio
-        sell_ratio = manager.should_partial_sell(current_pnl)
-        
-        # Then: 매도 신호가 없어야 함
-        assert sell_ratio is None
-    
-    @given(
-        target_profit=st.floats(min_value=0.2, max_value=5.0, allow_nan=False, allow_infinity=False),
-        total_quantity=st.floats(min_value=0.001, max_value=1000.0, allow_nan=False, allow_infinity=False),
-        pnl_ratio=st.floats(min_value=0.5, max_value=0.99, allow_nan=False, allow_infinity=False)
-    )
-    def test_first_partial_sell_only_once(self, target_profit, total_quantity, pnl_ratio):
-        """
-        **Feature: stop-loss-averaging-strategy, Property 37: 첫 번째 부분 매도**
-        
-        첫 번째 부분 매도는 한 번만 실행되어야 한다
-        **검증: 요구사항 9.1**
-        """
-        # Given: 부분 매도 관리자 생성
-        manager = PartialSellManager(target_profit)
-        
-        # When: 목표 수익률의 50% 이상에 처음 도달
-        current_pnl = target_profit * pnl_ratio
-        first_sell_ratio = manager.should_partial_sell(current_pnl)
-        
-        # Then: 첫 번째 매도 신호가 있어야 함
-        assert first_sell_ratio == 0.3
-        
-        # When: 같은 수익률에서 다시 확인
-        second_sell_ratio = manager.should_partial_sell(current_pnl)
-        
-        # Then: 두 번째 매도 신호는 없어야 함 (이미 완료됨)
-        assert second_sell_ratio is None
-    
-    @given(
-        target_profit=st.floats(min_value=0.2, max_value=5.0, allow_nan=False, allow_infinity=False),
-        total_quantity=st.floats(min_value=0.001, max_value=1000.0, allow_nan=False, allow_infinity=False)
-    )
-    def test_first_partial_sell_exact_threshold(self, target_profit, total_quantity):
-        """
-        **Feature: stop-loss-averaging-strategy, Property 37: 첫 번째 부분 매도**
-        
-        정확히 목표 수익률의 50%에서 첫 번째 부분 매도가 실행되어야 한다
-        **검증: 요구사항 9.1**
-        """
-        # Given: 부분 매도 관리자 생성
-        manager = PartialSellManager(target_profit)
-        
-        # When: 정확히 목표 수익률의 50%에 도달
-        current_pnl = target_profit * 0.5
-        sell_ratio = manager.should_partial_sell(current_pnl)
-        
-        # Then: 30% 매도 비율이 반환되어야 함
-        assert sell_ratio == 0.3
-        
-        # And: 매도 수량 계산이 정확해야 함
-        sell_quantity = manager.calculate_sell_quantity(total_quantity, sell_ratio)
-        expected_quantity = total_quantity * 0.3
-        
-        # 부동소수점 오차 허용
-        assert abs(sell_quantity - expected_quantity) < 0.000001
-    
-    @given(
-        target_profit=st.floats(min_value=0.2, max_value=5.0, allow_nan=False, allow_infinity=False),
-        total_quantity=st.floats(min_value=0.001, max_value=1000.0, allow_nan=False, allow_infinity=False),
-        pnl_ratio=st.floats(min_value=0.5, max_value=2.0, allow_nan=False, allow_infinity=False)
-    )
-    def test_first_partial_sell_quantity_never_exceeds_total(self, target_profit, total_quantity, pnl_ratio):
-        """
-        **Feature: stop-loss-averaging-strategy, Property 37: 첫 번째 부분 매도**
-        
-        첫 번째 부분 매도 수량이 총 보유 수량을 초과하지 않아야 한다
-        **검증: 요구사항 9.1**
-        """
+@functools.lru_cache(maxsize=128)
+def _cached_manager(target_profit):
+    """목표 수익률별 부분 매도 관리자 인스턴스 (예제 간 재사용)"""
+    return PartialSellManager(target_profit)
+
+
+def _fresh_manager(target_profit):
+    """매도 레벨이 초기화된 부분 매도 관리자 반환"""
+    manager = _cached_manager(target_profit)
+    manager.reset()
+    return manager
+
+
+_TARGET_PROFITS = st.floats(min_value=0.2, max_value=5.0, allow_nan=False, allow_infinity=False)
+_TOTAL_QUANTITIES = st.floats(min_value=0.001, max_value=1000.0, allow_nan=False, allow_infinity=False)
+
+# 목표 수익률 대비 손익 비율: 50% 바로 아래, 정확히 50%, 50% 이상 구간
+_PNL_RATIOS = st.one_of(
+    st.floats(min_value=0.49, max_value=0.499, allow_nan=False, allow_infinity=False),
+    st.just(0.5),
+    st.floats(min_value=0.5, max_value=2.0, allow_nan=False, allow_infinity=False)
+)
+
+
+class FirstPartialSellStateMachine(RuleBasedStateMachine):
+    """
+    **Feature: stop-loss-averaging-strategy, Property 37: 첫 번째 부분 매도**
+
+    모든 포지션에서, 목표 수익률의 50% 도달 시 포지션의 30%가 한 번만 부분 매도되어야 하고
+    매도 수량은 총 보유 수량을 초과하지 않아야 한다
+    **검증: 요구사항 9.1**
+    """
+
+    @initialize(target_profit=_TARGET_PROFITS, total_quantity=_TOTAL_QUANTITIES)
+    def setup(self, target_profit, total_quantity):
         # Given: 부분 매도 관리자 생성
-        manager = PartialSellManager(target_profit)
-        
-        # When: 목표 수익률의 50% 이상에 도달
-        current_pnl = target_profit * pnl_ratio
-        sell_ratio = manager.should_partial_sell(current_pnl)
-        
+        self.manager = _fresh_manager(target_profit)
+        self.target_profit = target_profit
+        self.total_quantity = total_quantity
+
+        # 모델 상태: 각 매도 레벨(50%에서 30%, 100%에서 50%)의 완료 여부
+        self.first_sold = False
+        self.second_sold = False
+
+    @rule(pnl_ratio=_PNL_RATIOS)
+    def check_partial_sell(self, pnl_ratio):
+        # When: 목표 수익률의 pnl_ratio 배에 도달
+        current_pnl = self.target_profit * pnl_ratio
+        achievement_ratio = current_pnl / self.target_profit
+        sell_ratio = self.manager.should_partial_sell(current_pnl)
+
+        # Then: 50% 미만이면 매도 없음, 처음 50% 이상이면 30% 매도 (한 번만)
+        if not self.first_sold and achievement_ratio >= 0.5:
+            assert sell_ratio == 0.3
+            self.first_sold = True
+        elif not self.second_sold and achievement_ratio >= 1.0:
+            assert sell_ratio == 0.5
+            self.second_sold = True
+        else:
+            assert sell_ratio is None
+
+        # And: 매도 수량이 정확히 계산되고 총 수량을 초과하지 않아야 함
         if sell_ratio is not None:
-            # Then: 매도 수량이 총 수량을 초과하지 않아야 함
-            sell_quantity = manager.calculate_sell_quantity(total_quantity, sell_ratio)
-            assert sell_quantity <= total_quantity
-            assert sell_quantity > 0
-    
-    @given(
-        target_profit=st.floats(min_value=0.2, max_value=5.0, allow_nan=False, allow_infinity=False)
-    )
-    def test_get_next_sell_level_shows_first_partial_sell(self, target_profit):
-        """
-        **Feature: stop-loss-averaging-strategy, Property 37: 첫 번째 부분 매도**
-        
-        초기 상태에서 다음 매도 레벨이 첫 번째 부분 매도를 가리켜야 한다
-        **검증: 요구사항 9.1**
-        """
-        # Given: 부분 매도 관리자 생성
-        manager = PartialSellManager(target_profit)
-        
-        # When: 다음 매도 레벨 조회
-        next_level = manager.get_next_sell_level()
-        
-        # Then: 첫 번째 부분 매도 정보가 반환되어야 함
+            sell_quantity = self.manager.calculate_sell_quantity(self.total_quantity, sell_ratio)
+            assert abs(sell_quantity - self.total_quantity * sell_ratio) < 0.000001
+            assert 0 < sell_quantity <= self.total_quantity
+
+    @invariant()
+    def next_level_shows_first_partial_sell(self):
+        # 첫 번째 부분 매도 전에는 다음 매도 레벨이 첫 번째 부분 매도를 가리켜야 함
+        if self.first_sold:
+            return
+
+        next_level = self.manager.get_next_sell_level()
         assert next_level is not None
-        assert next_level['threshold_percent'] == target_profit * 0.5
+        assert next_level['threshold_percent'] == self.target_profit * 0.5
         assert next_level['sell_ratio'] == 0.3
         assert "50%" in next_level['description']
-        assert "30%" in next_level['description']
\ No newline at end of file
+        assert "30%" in next_level['description']
+
+
+FirstPartialSellStateMachine.TestCase.settings = settings(max_examples=50, stateful_step_count=20)
+TestFirstPartialSell = FirstPartialSellStateMachine.TestCase
@@ -5,20 +5,43 @@
 """
 
 import pytest
-import tempfile
 import json
 import logging
+import logging.handlers
 import os
+import re
+import sys
 import time
+from itertools import islice
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
-from hypothesis import given, strategies as st, assume, settings
+from hypothesis import given, strategies as st, assume, settings, Phase, HealthCheck
 from hypothesis.strategies import composite
 from unittest.mock import patch, MagicMock
 
 from upbit_trading_bot.logging.logger import LoggerManager, get_logger
 
+try:
+    from orjson import loads as _loads, JSONDecodeError as _JSONDecodeError
+except ImportError:  # orjson은 선택 의존성: 없으면 표준 라이브러리 디코더 사용
+    from json import loads as _loads, JSONDecodeError as _JSONDecodeError
+
+
+# 로그 레벨 이름 -> logging 상수 (반복문에서 getattr 조회를 피하기 위함)
+_LEVELS = {name: getattr(logging, name) for name in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')}
+
+# "<LEVEL> message" 형태의 테스트 메시지에서 레벨 이름을 한 번에 추출
+_LEVEL_MESSAGE_RE = re.compile(r'\b(DEBUG|INFO|WARNING|ERROR|CRITICAL) message')
+
+# 로그 메시지 크기 구간별 채움 문자열 (문자 단위 생성/축소 비용을 피하기 위함)
+_FILLERS = tuple("x" * n for n in (64, 256, 1024))
+
+# 고정 크기 테스트들의 메시지 채움 문자열
+_FILLER_X = "x" * 100
+_FILLER_MED = "content " * 20
+_FILLER_DATA = "data " * 50
+_FILLER_LONG = "content " * 30
 
 @composite
 def log_rotation_config(draw):
@@ -32,7 +55,7 @@ def log_rotation_config(draw):
     config['backup_count'] = draw(st.integers(min_value=1, max_value=100))
     
     # 로그 레벨
-    config['log_level'] = draw(st.sampled_from(['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']))
+    config['log_level'] = draw(st.sampled_from(tuple(_LEVELS)))
     
     return config
 
@@ -40,16 +63,17 @@ def log_rotation_config(draw):
 @composite
 def log_message_data(draw):
     """로그 메시지 데이터 생성."""
-    # 다양한 크기의 로그 메시지 생성
-    message_size = draw(st.integers(min_value=10, max_value=1000))
-    message = draw(st.text(
-        min_size=message_size,
-        max_size=message_size,
+    # 다양한 크기의 로그 메시지 생성 (짧은 접두어 + 미리 만든 채움 문자열)
+    prefix = draw(st.text(
+        min_size=1,
+        max_size=8,
         alphabet=st.characters(min_codepoint=32, max_codepoint=126)
     ))
+    filler = _FILLERS[draw(st.integers(min_value=0, max_value=len(_FILLERS) - 1))]
+    message = prefix + filler * draw(st.integers(min_value=1, max_value=4))
     
     # 로그 레벨
-    level = draw(st.sampled_from(['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']))
+    level = draw(st.sampled_from(tuple(_LEVELS.values())))
     
     # 추가 컨텍스트
     context = {
@@ -62,439 +86,515 @@ def log_message_data(draw):
         'timestamp': datetime.now().isoformat()
     }
     
-    return message, level, context
+    # 대략적인 로그 크기 계산 (JSON 구조화 고려, 메타데이터 200바이트 추가)
+    estimated_size = len(message) + len(json.dumps(context, separators=(",", ":"))) + 200
+    
+    return message, level, context, estimated_size
+
+
+# 모듈 로드 시 한 번만 만드는 Hypothesis 전략 객체
+_ROTATION_CFG = log_rotation_config()
+_MSG = log_message_data()
+_MSG_LIST = st.lists(_MSG, min_size=5, max_size=20)
+
+
+@pytest.fixture(scope="class")
+def shared_log_dir(tmp_path_factory):
+    """Hypothesis 예제들이 공유하는 로그 디렉토리."""
+    return tmp_path_factory.mktemp("logs")
+
+
+@pytest.fixture(scope="class")
+def shared_logger_manager(shared_log_dir):
+    """Hypothesis 예제들이 공유하는 LoggerManager."""
+    logger_manager = LoggerManager(
+        log_dir=str(shared_log_dir),
+        log_level="DEBUG",
+        console_output=False,
+        structured_format=True
+    )
+    yield logger_manager
+    for handler in logger_manager._handlers:
+        handler.close()
+
+
+def _reset_logger_manager(logger_manager, log_level, max_file_size, backup_count):
+    """공유 LoggerManager를 예제별 순환 설정으로 재설정하고 로그 파일을 비운다."""
+    handlers = logger_manager._handlers
+    root_logger = logging.getLogger()
+    root_logger.handlers[:] = handlers
+    root_logger.setLevel(log_level)
+    
+    file_handlers = [
+        handler for handler in handlers
+        if isinstance(handler, logging.handlers.RotatingFileHandler)
+    ]
+    for handler in file_handlers:
+        handler.close()
+        handler.maxBytes = max_file_size
+        handler.backupCount = backup_count
+        if handler.level != logging.ERROR:
+            handler.setLevel(log_level)
+    
+    for log_file in logger_manager.log_dir.iterdir():
+        log_file.unlink()
+    
+    # 핸들러는 다음 emit 시 파일을 다시 열고, 새 LoggerManager처럼 빈 활성 로그 파일은 즉시 생성
+    for handler in file_handlers:
+        handler.stream = None
+        Path(handler.baseFilename).touch()
+    
+    return logger_manager
+
 
+def _write_backdated_logs(log_dir, days_ago_range):
+    """days_ago 일 전으로 수정 시간이 설정된 백업 로그 파일들을 한 번에 생성."""
+    current_time = time.time()
+    payload = b"Log content from %d days ago"
+    dir_fd = os.open(str(log_dir), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for days_ago in days_ago_range:
+            name = f"trading_bot.log.{days_ago}"
+            file_time = current_time - (days_ago * 24 * 60 * 60)  # days_ago 일 전
+            
+            fd = os.open(name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, dir_fd=dir_fd)
+            try:
+                os.write(fd, payload % days_ago)
+            finally:
+                os.close(fd)
+            
+            # 파일의 수정 시간을 과거로 설정
+            os.utime(name, (file_time, file_time), dir_fd=dir_fd, follow_symlinks=False)
+    finally:
+        os.close(dir_fd)
 
+
+def _log_entries(log_dir):
+    """os.scandir 한 번으로 로그 파일들의 (이름, 경로, stat) 목록을 반환."""
+    with os.scandir(log_dir) as it:
+        return [
+            (entry.name, entry.path, entry.stat(follow_symlinks=False))
+            for entry in it
+            if entry.is_file(follow_symlinks=False) and '.log' in entry.name
+        ]
+
+
+def _partition_backups(entries):
+    """_log_entries 결과를 한 번 순회하여 (메인 로그 백업, 에러 로그 백업) 목록으로 분리."""
+    main_backups, error_backups = [], []
+    for entry in entries:
+        prefix, sep, _ = entry[0].partition('.log.')
+        if not sep:
+            continue  # 현재 활성 파일
+        if prefix == 'trading_bot':
+            main_backups.append(entry)
+        elif prefix == 'errors':
+            error_backups.append(entry)
+    return main_backups, error_backups
+
+
+def _make_record(logger, level, message, extra):
+    """logger.info(message, extra=extra)가 만드는 것과 같은 LogRecord를 미리 생성."""
+    return logger.makeRecord(logger.name, level, __file__, 0, message, None, None, extra=extra)
+
+
+def _dispatch_records(records, handlers):
+    """Logger.log 경로를 거치지 않고 미리 만든 레코드를 핸들러에 직접 전달."""
+    for record in records:
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+def _has_valid_entry(path):
+    """로그 파일을 한 줄씩 읽어 timestamp와 level을 가진 JSON 엔트리가 있는지 확인."""
+    with open(path, 'r', encoding='utf-8', buffering=1 << 16) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                log_entry = _loads(line)
+            except _JSONDecodeError:
+                continue  # 구조화되지 않은 로그 라인은 무시
+            if 'timestamp' in log_entry and 'level' in log_entry:
+                return True
+    return False
+
+
+@pytest.mark.slow
+@pytest.mark.xdist_group(name="log_rotation")  # 루트 로거 핸들러를 공유하므로 한 워커에서 실행
 class TestLogRotationConsistency:
     """로그 순환 일관성을 위한 속성 기반 테스트."""
     
     @given(
-        rotation_config=log_rotation_config(),
-        log_messages=st.lists(log_message_data(), min_size=5, max_size=20)
+        rotation_config=_ROTATION_CFG,
+        log_messages=_MSG_LIST
+    )
+    @settings(
+        max_examples=10,
+        deadline=None,
+        derandomize=True,
+        database=None,
+        phases=(Phase.generate,),
+        suppress_health_check=[HealthCheck.too_slow]
     )
-    @settings(max_examples=10, deadline=15000)
-    def test_property_23_log_rotation_consistency(self, rotation_config, log_messages):
+    def test_property_23_log_rotation_consistency(self, shared_logger_manager, rotation_config, log_messages):
         """
         **Feature: upbit-trading-bot, Property 23: 로그 순환 일관성**
         **Validates: Requirements 8.3**
         
         속성: 모든 일일 운영에 대해, 로그 파일들은 순환되어야 하고 최소 30일간 유지되어야 한다.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-            log_dir.mkdir()
-            
-            # 작은 파일 크기로 설정하여 순환을 강제로 발생시킴
-            small_max_size = min(rotation_config['max_file_size'], 5000)  # 최대 5KB
-            
-            logger_manager = LoggerManager(
-                log_dir=str(log_dir),
-                log_level=rotation_config['log_level'],
-                max_file_size=small_max_size,
-                backup_count=rotation_config['backup_count'],
-                console_output=False,
-                structured_format=True
-            )
-            
-            test_logger = logger_manager.get_logger("test_rotation")
-            
-            # 초기 로그 파일 상태 확인
-            initial_files = list(log_dir.glob("*.log*"))
-            initial_count = len(initial_files)
-            
-            # 로그 메시지들을 기록하여 파일 순환 유발
-            total_logged_size = 0
-            for message, level, context in log_messages:
-                log_level = getattr(logging, level)
-                test_logger.log(log_level, message, extra=context)
-                
-                # 대략적인 로그 크기 계산 (JSON 구조화 고려)
-                estimated_size = len(message) + len(json.dumps(context)) + 200  # 메타데이터 추가
-                total_logged_size += estimated_size
-            
-            # 로그 파일들이 디스크에 기록되도록 강제 플러시
-            for handler in logging.getLogger().handlers:
-                if hasattr(handler, 'flush'):
-                    handler.flush()
-            
-            # 순환 후 파일 상태 확인
-            final_files = list(log_dir.glob("*.log*"))
-            
-            # 속성 1: 로그 파일이 존재해야 함
-            assert len(final_files) > 0, "로그 파일이 최소 하나는 존재해야 함"
-            
-            # 속성 2: 메인 로그 파일들이 존재해야 함
-            main_log_file = log_dir / "trading_bot.log"
-            error_log_file = log_dir / "errors.log"
-            assert main_log_file.exists(), "메인 로그 파일이 존재해야 함"
-            assert error_log_file.exists(), "에러 로그 파일이 존재해야 함"
-            
-            # 속성 3: 충분한 데이터가 로그되었다면 순환이 발생했을 수 있음
-            if total_logged_size > small_max_size:
-                # 순환된 파일들 확인 (*.log.1, *.log.2 등)
-                rotated_files = [f for f in final_files if '.log.' in f.name]
+        # 작은 파일 크기로 설정하여 순환을 강제로 발생시킴
+        small_max_size = min(rotation_config['max_file_size'], 5000)  # 최대 5KB
+        
+        # 예제마다 LoggerManager를 새로 만드는 대신 공유 인스턴스를 재설정
+        logger_manager = _reset_logger_manager(
+            shared_logger_manager,
+            _LEVELS[rotation_config['log_level']],
+            small_max_size,
+            rotation_config['backup_count']
+        )
+        log_dir = logger_manager.log_dir
+        
+        test_logger = logger_manager.get_logger("test_rotation")
+        
+        # 로그 메시지들을 기록하여 파일 순환 유발
+        total_logged_size = 0
+        for message, level, context, estimated_size in log_messages:
+            test_logger.log(level, message, extra=context)
+            total_logged_size += estimated_size
+        
+        # 로그 파일들이 디스크에 기록되도록 강제 플러시
+        logger_manager.flush_all()
+        
+        # 순환 후 파일 상태 확인
+        final_files = _log_entries(log_dir)
+        
+        # 속성 1: 로그 파일이 존재해야 함
+        assert len(final_files) > 0, "로그 파일이 최소 하나는 존재해야 함"
+        
+        # 속성 2: 메인 로그 파일들이 존재해야 함
+        main_log_file = log_dir / "trading_bot.log"
+        error_log_file = log_dir / "errors.log"
+        assert main_log_file.exists(), "메인 로그 파일이 존재해야 함"
+        assert error_log_file.exists(), "에러 로그 파일이 존재해야 함"
+        
+        # 속성 3: 충분한 데이터가 로그되었다면 순환이 발생했을 수 있음
+        if total_logged_size > small_max_size:
+            # 순환된 파일들을 로그 타입별로 확인 (*.log.1, *.log.2 등)
+            main_backups, error_backups = _partition_backups(final_files)
+            
+            # 순환이 발생했다면, 백업 파일 개수가 설정된 범위 내에 있어야 함
+            if main_backups or error_backups:
+                # 백업 파일 개수가 설정된 backup_count를 초과하지 않아야 함
+                assert len(main_backups) <= rotation_config['backup_count'], \
+                    f"메인 로그 백업 파일 개수가 설정값을 초과함: {len(main_backups)} > {rotation_config['backup_count']}"
                 
-                # 순환이 발생했다면, 백업 파일 개수가 설정된 범위 내에 있어야 함
-                if len(rotated_files) > 0:
-                    # 각 로그 타입별로 백업 파일 개수 확인
-                    main_backups = [f for f in rotated_files if f.name.startswith('trading_bot.log.')]
-                    error_backups = [f for f in rotated_files if f.name.startswith('errors.log.')]
-                    
-                    # 백업 파일 개수가 설정된 backup_count를 초과하지 않아야 함
-                    assert len(main_backups) <= rotation_config['backup_count'], \
-                        f"메인 로그 백업 파일 개수가 설정값을 초과함: {len(main_backups)} > {rotation_config['backup_count']}"
-                    
-                    assert len(error_backups) <= rotation_config['backup_count'], \
-                        f"에러 로그 백업 파일 개수가 설정값을 초과함: {len(error_backups)} > {rotation_config['backup_count']}"
-            
-            # 속성 4: 모든 로그 파일의 크기가 설정된 최대 크기를 초과하지 않아야 함
-            for log_file in final_files:
-                if log_file.is_file() and not log_file.name.endswith('.log.1'):  # 현재 활성 파일만 확인
-                    file_size = log_file.stat().st_size
-                    # 현재 활성 파일은 최대 크기를 초과할 수 있지만, 백업 파일들은 초과하지 않아야 함
-                    if '.log.' in log_file.name:  # 백업 파일인 경우
-                        assert file_size <= small_max_size * 1.1, \
-                            f"백업 로그 파일 크기가 설정값을 크게 초과함: {file_size} > {small_max_size}"
-            
-            # 속성 5: 로그 파일들이 읽기 가능하고 유효한 내용을 포함해야 함
-            for log_file in final_files:
-                if log_file.is_file() and log_file.suffix == '.log' or '.log.' in log_file.name:
-                    try:
-                        with open(log_file, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            # 파일이 비어있지 않다면 유효한 로그 엔트리가 있어야 함
-                            if content.strip():
-                                lines = content.strip().split('\n')
-                                # 최소 하나의 유효한 JSON 로그 엔트리가 있어야 함
-                                valid_entries = 0
-                                for line in lines:
-                                    try:
-                                        log_entry = json.loads(line)
-                                        if 'timestamp' in log_entry and 'level' in log_entry:
-                                            valid_entries += 1
-                                    except json.JSONDecodeError:
-                                        pass  # 구조화되지 않은 로그 라인은 무시
-                                
-                                assert valid_entries > 0, f"로그 파일에 유효한 엔트리가 없음: {log_file}"
-                    except Exception as e:
-                        pytest.fail(f"로그 파일을 읽을 수 없음 {log_file}: {e}")
+                assert len(error_backups) <= rotation_config['backup_count'], \
+                    f"에러 로그 백업 파일 개수가 설정값을 초과함: {len(error_backups)} > {rotation_config['backup_count']}"
+        
+        # 속성 4: 모든 로그 파일의 크기가 설정된 최대 크기를 초과하지 않아야 함
+        for name, path, file_stat in final_files:
+            if not name.endswith('.log.1'):  # 현재 활성 파일만 확인
+                file_size = file_stat.st_size
+                # 현재 활성 파일은 최대 크기를 초과할 수 있지만, 백업 파일들은 초과하지 않아야 함
+                # (RotatingFileHandler는 레코드를 나누지 않으므로 단일 레코드 파일은 예외)
+                if '.log.' in name and file_size > small_max_size * 1.1:  # 백업 파일인 경우
+                    with open(path, 'r', encoding='utf-8') as f:
+                        record_count = sum(1 for line in f if line.strip())
+                    assert record_count == 1, \
+                        f"백업 로그 파일 크기가 설정값을 크게 초과함: {file_size} > {small_max_size}"
+        
+        # 속성 5: 로그 파일들이 읽기 가능하고 유효한 내용을 포함해야 함
+        for name, path, file_stat in final_files:
+            if name.endswith('.log') or '.log.' in name:
+                try:
+                    # 파일이 비어있지 않다면 최소 하나의 유효한 JSON 로그 엔트리가 있어야 함
+                    if file_stat.st_size > 0:
+                        assert _has_valid_entry(path), f"로그 파일에 유효한 엔트리가 없음: {path}"
+                except AssertionError:
+                    raise
+                except Exception as e:
+                    pytest.fail(f"로그 파일을 읽을 수 없음 {path}: {e}")
     
-    def test_log_retention_policy(self):
+    def test_log_retention_policy(self, tmp_path):
         """로그 보존 정책 테스트 (30일 보존 요구사항)."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-            log_dir.mkdir()
-            
-            logger_manager = LoggerManager(
-                log_dir=str(log_dir),
-                log_level="INFO",
-                max_file_size=1024,  # 1KB로 작게 설정
-                backup_count=30,  # 30일 보존
-                console_output=False,
-                structured_format=True
-            )
-            
-            # 오래된 로그 파일들을 시뮬레이션하기 위해 생성
-            old_files = []
-            current_time = time.time()
-            
-            # 35일 전부터 오늘까지의 로그 파일들 생성
-            for days_ago in range(35, 0, -1):
-                file_time = current_time - (days_ago * 24 * 60 * 60)  # days_ago 일 전
-                
-                old_file = log_dir / f"trading_bot.log.{days_ago}"
-                old_file.write_text(f"Log content from {days_ago} days ago")
-                
-                # 파일의 수정 시간을 과거로 설정
-                os.utime(old_file, (file_time, file_time))
-                old_files.append(old_file)
-            
-            # 정리 작업 실행
-            logger_manager.cleanup_old_logs(retention_days=30)
-            
-            # 30일 이내의 파일들은 유지되어야 함
-            remaining_files = list(log_dir.glob("*.log*"))
-            
-            # 30일보다 오래된 파일들이 삭제되었는지 확인
-            for days_ago in range(35, 30, -1):  # 31일 ~ 35일 전 파일들
-                old_file = log_dir / f"trading_bot.log.{days_ago}"
-                assert not old_file.exists(), f"{days_ago}일 전 파일이 삭제되지 않음: {old_file}"
-            
-            # 30일 이내의 파일들은 유지되어야 함
-            for days_ago in range(30, 0, -1):  # 1일 ~ 30일 전 파일들
-                old_file = log_dir / f"trading_bot.log.{days_ago}"
-                assert old_file.exists(), f"{days_ago}일 전 파일이 잘못 삭제됨: {old_file}"
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        
+        logger_manager = LoggerManager(
+            log_dir=str(log_dir),
+            log_level="INFO",
+            max_file_size=1024,  # 1KB로 작게 설정
+            backup_count=30,  # 30일 보존
+            console_output=False,
+            structured_format=True
+        )
+        
+        # 오래된 로그 파일들을 시뮬레이션하기 위해 35일 전부터 오늘까지의 로그 파일들 생성
+        _write_backdated_logs(log_dir, range(35, 0, -1))
+        
+        # 정리 작업 실행
+        logger_manager.cleanup_old_logs(retention_days=30)
+        
+        # 30일보다 오래된 파일들이 삭제되었는지 확인
+        for days_ago in range(35, 30, -1):  # 31일 ~ 35일 전 파일들
+            old_file = log_dir / f"trading_bot.log.{days_ago}"
+            assert not old_file.exists(), f"{days_ago}일 전 파일이 삭제되지 않음: {old_file}"
+        
+        # 30일 이내의 파일들은 유지되어야 함
+        for days_ago in range(30, 0, -1):  # 1일 ~ 30일 전 파일들
+            old_file = log_dir / f"trading_bot.log.{days_ago}"
+            assert old_file.exists(), f"{days_ago}일 전 파일이 잘못 삭제됨: {old_file}"
     
-    def test_concurrent_log_rotation(self):
+    def test_concurrent_log_rotation(self, tmp_path):
         """동시 로그 순환 테스트."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-            log_dir.mkdir()
-            
-            # 매우 작은 파일 크기로 설정하여 빠른 순환 유발
-            logger_manager = LoggerManager(
-                log_dir=str(log_dir),
-                log_level="INFO",
-                max_file_size=500,  # 500 bytes
-                backup_count=5,
-                console_output=False,
-                structured_format=True
-            )
-            
-            # 여러 로거에서 동시에 로그 기록
-            loggers = [
-                logger_manager.get_logger(f"test_logger_{i}")
-                for i in range(3)
-            ]
-            
-            # 각 로거에서 많은 로그 메시지 생성
-            for i in range(50):
-                for j, logger in enumerate(loggers):
-                    message = f"Test message {i} from logger {j} " + "x" * 100  # 긴 메시지
-                    logger.info(message, extra={
-                        'logger_id': j,
-                        'message_id': i,
-                        'component': f'test_component_{j}'
-                    })
-            
-            # 모든 핸들러 플러시
-            for handler in logging.getLogger().handlers:
-                if hasattr(handler, 'flush'):
-                    handler.flush()
-            
-            # 결과 확인
-            log_files = list(log_dir.glob("*.log*"))
-            
-            # 로그 파일들이 생성되었는지 확인
-            assert len(log_files) > 0, "로그 파일이 생성되어야 함"
-            
-            # 메인 로그 파일 존재 확인
-            main_log = log_dir / "trading_bot.log"
-            assert main_log.exists(), "메인 로그 파일이 존재해야 함"
-            
-            # 순환된 파일들 확인
-            rotated_files = [f for f in log_files if '.log.' in f.name]
-            
-            # 백업 파일 개수가 설정값을 초과하지 않는지 확인
-            main_backups = [f for f in rotated_files if f.name.startswith('trading_bot.log.')]
-            assert len(main_backups) <= 5, f"백업 파일 개수가 설정값을 초과함: {len(main_backups)}"
-            
-            # 모든 로그 파일이 읽기 가능한지 확인
-            for log_file in log_files:
-                if log_file.is_file():
-                    try:
-                        with open(log_file, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            # 내용이 있다면 유효한 JSON 로그여야 함
-                            if content.strip():
-                                lines = content.strip().split('\n')
-                                for line in lines[:5]:  # 처음 5줄만 확인
-                                    if line.strip():
-                                        log_entry = json.loads(line)
-                                        assert 'timestamp' in log_entry
-                                        assert 'level' in log_entry
-                                        assert 'message' in log_entry
-                    except Exception as e:
-                        pytest.fail(f"로그 파일 읽기 실패 {log_file}: {e}")
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        
+        # 매우 작은 파일 크기로 설정하여 빠른 순환 유발
+        logger_manager = LoggerManager(
+            log_dir=str(log_dir),
+            log_level="INFO",
+            max_file_size=500,  # 500 bytes
+            backup_count=5,
+            console_output=False,
+            structured_format=True
+        )
+        
+        # 여러 로거에서 동시에 로그 기록
+        loggers = [
+            logger_manager.get_logger(f"test_logger_{i}")
+            for i in range(3)
+        ]
+        
+        # 각 로거에서 많은 로그 메시지 생성
+        records = [
+            _make_record(logger, logging.INFO, f"Test message {i} from logger {j} {_FILLER_X}", {  # 긴 메시지
+                'logger_id': j,
+                'message_id': i,
+                'component': f'test_component_{j}'
+            })
+            for i in range(50)
+            for j, logger in enumerate(loggers)
+        ]
+        _dispatch_records(records, logger_manager._handlers)
+        
+        # 모든 핸들러 플러시
+        logger_manager.flush_all()
+        
+        # 결과 확인
+        log_files = _log_entries(log_dir)
+        
+        # 로그 파일들이 생성되었는지 확인
+        assert len(log_files) > 0, "로그 파일이 생성되어야 함"
+        
+        # 메인 로그 파일 존재 확인
+        main_log = log_dir / "trading_bot.log"
+        assert main_log.exists(), "메인 로그 파일이 존재해야 함"
+        
+        # 순환된 파일들 확인
+        main_backups, _ = _partition_backups(log_files)
+        
+        # 백업 파일 개수가 설정값을 초과하지 않는지 확인
+        assert len(main_backups) <= 5, f"백업 파일 개수가 설정값을 초과함: {len(main_backups)}"
+        
+        # 모든 로그 파일이 읽기 가능한지 확인
+        for name, path, file_stat in log_files:
+            try:
+                with open(path, 'r', encoding='utf-8', buffering=1 << 16) as f:
+                    # 내용이 있다면 유효한 JSON 로그여야 함 (처음 5줄만 확인)
+                    for line in islice(f, 5):
+                        if line.strip():
+                            log_entry = _loads(line)
+                            assert 'timestamp' in log_entry
+                            assert 'level' in log_entry
+                            assert 'message' in log_entry
+            except Exception as e:
+                pytest.fail(f"로그 파일 읽기 실패 {path}: {e}")
     
-    def test_log_rotation_with_different_levels(self):
+    def test_log_rotation_with_different_levels(self, tmp_path):
         """다양한 로그 레벨에서의 순환 테스트."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-            log_dir.mkdir()
-            
-            logger_manager = LoggerManager(
-                log_dir=str(log_dir),
-                log_level="DEBUG",
-                max_file_size=1000,  # 1KB
-                backup_count=3,
-                console_output=False,
-                structured_format=True
-            )
-            
-            test_logger = logger_manager.get_logger("test_levels")
-            
-            # 다양한 레벨의 로그 메시지 대량 생성
-            log_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-            
-            for i in range(20):
-                for level_name in log_levels:
-                    level = getattr(logging, level_name)
-                    message = f"{level_name} message {i} " + "content " * 20  # 긴 메시지
-                    
-                    context = {
-                        'level_name': level_name,
-                        'message_id': i,
-                        'test_type': 'level_rotation_test'
-                    }
-                    
-                    if level_name == 'ERROR' or level_name == 'CRITICAL':
-                        # 에러 레벨은 예외 정보와 함께
-                        try:
-                            raise ValueError(f"Test {level_name} exception {i}")
-                        except ValueError as e:
-                            test_logger.log(level, message, extra=context, exc_info=True)
-                    else:
-                        test_logger.log(level, message, extra=context)
-            
-            # 핸들러 플러시
-            for handler in logging.getLogger().handlers:
-                if hasattr(handler, 'flush'):
-                    handler.flush()
-            
-            # 결과 검증
-            log_files = list(log_dir.glob("*.log*"))
-            
-            # 메인 로그와 에러 로그 파일 모두 존재해야 함
-            main_log = log_dir / "trading_bot.log"
-            error_log = log_dir / "errors.log"
-            
-            assert main_log.exists(), "메인 로그 파일이 존재해야 함"
-            assert error_log.exists(), "에러 로그 파일이 존재해야 함"
-            
-            # 에러 로그에는 ERROR와 CRITICAL 레벨만 있어야 함
-            with open(error_log, 'r', encoding='utf-8') as f:
-                error_content = f.read()
-                error_lines = [line for line in error_content.strip().split('\n') if line.strip()]
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        
+        logger_manager = LoggerManager(
+            log_dir=str(log_dir),
+            log_level="DEBUG",
+            max_file_size=1000,  # 1KB
+            backup_count=3,
+            console_output=False,
+            structured_format=True
+        )
+        
+        test_logger = logger_manager.get_logger("test_levels")
+        
+        # 에러 레벨 로그에 붙일 예외 정보는 한 번만 만들어 재사용
+        try:
+            raise ValueError("Test exception")
+        except ValueError:
+            exc_info = sys.exc_info()
+        
+        # 다양한 레벨의 로그 메시지 대량 생성
+        for i in range(20):
+            for level_name, level in _LEVELS.items():
+                message = f"{level_name} message {i} {_FILLER_MED}"  # 긴 메시지
                 
-                for line in error_lines:
-                    try:
-                        log_entry = json.loads(line)
-                        assert log_entry['level'] in ['ERROR', 'CRITICAL'], \
-                            f"에러 로그에 잘못된 레벨이 포함됨: {log_entry['level']}"
-                    except json.JSONDecodeError:
-                        pass  # 구조화되지 않은 로그 라인은 무시
-            
-            # 메인 로그와 백업 파일들에서 모든 레벨이 있는지 확인
-            all_main_content = ""
-            
-            # 현재 메인 로그 파일 읽기
-            with open(main_log, 'r', encoding='utf-8') as f:
-                all_main_content += f.read()
-            
-            # 백업 파일들도 읽기 (순환으로 인해 일부 메시지가 백업 파일에 있을 수 있음)
-            main_backup_files = [f for f in log_files if f.name.startswith('trading_bot.log.')]
-            for backup_file in main_backup_files:
+                context = {
+                    'level_name': level_name,
+                    'message_id': i,
+                    'test_type': 'level_rotation_test'
+                }
+                
+                if level_name == 'ERROR' or level_name == 'CRITICAL':
+                    # 에러 레벨은 예외 정보와 함께
+                    test_logger.log(level, message, extra=context, exc_info=exc_info)
+                else:
+                    test_logger.log(level, message, extra=context)
+        
+        # 핸들러 플러시
+        logger_manager.flush_all()
+        
+        # 결과 검증
+        log_files = _log_entries(log_dir)
+        
+        # 메인 로그와 에러 로그 파일 모두 존재해야 함
+        main_log = log_dir / "trading_bot.log"
+        error_log = log_dir / "errors.log"
+        
+        assert main_log.exists(), "메인 로그 파일이 존재해야 함"
+        assert error_log.exists(), "에러 로그 파일이 존재해야 함"
+        
+        # 에러 로그에는 ERROR와 CRITICAL 레벨만 있어야 함
+        with open(error_log, 'r', encoding='utf-8', buffering=1 << 16) as f:
+            for line in f:
+                if not line.strip():
+                    continue
                 try:
-                    with open(backup_file, 'r', encoding='utf-8') as f:
-                        all_main_content += f.read()
-                except Exception:
-                    pass  # 백업 파일 읽기 실패는 무시
-            
-            # 모든 메인 로그 내용에서 레벨 확인
-            found_levels = set()
-            for level_name in log_levels:
-                if f'"{level_name} message' in all_main_content or f'{level_name} message' in all_main_content:
-                    found_levels.add(level_name)
-            
-            # 최소한 일부 레벨은 찾아져야 함 (순환으로 인해 모든 레벨이 없을 수도 있음)
-            assert len(found_levels) > 0, "메인 로그에 어떤 레벨의 메시지도 없음"
-            
-            # ERROR와 CRITICAL 레벨은 반드시 있어야 함 (에러 로그에도 기록되므로)
-            error_critical_found = any(level in found_levels for level in ['ERROR', 'CRITICAL'])
-            assert error_critical_found, "메인 로그에 ERROR 또는 CRITICAL 레벨 메시지가 없음"
+                    log_entry = _loads(line)
+                    assert log_entry['level'] in ['ERROR', 'CRITICAL'], \
+                        f"에러 로그에 잘못된 레벨이 포함됨: {log_entry['level']}"
+                except _JSONDecodeError:
+                    pass  # 구조화되지 않은 로그 라인은 무시
+        
+        # 메인 로그와 백업 파일들에서 모든 레벨이 있는지 확인
+        # (순환으로 인해 일부 메시지가 백업 파일에 있을 수 있음)
+        found_levels = set()
+        main_backups, _ = _partition_backups(log_files)
+        for main_file in [main_log, *(path for _, path, _ in main_backups)]:
+            try:
+                with open(main_file, 'r', encoding='utf-8', buffering=1 << 16) as f:
+                    for line in f:
+                        found_levels.update(_LEVEL_MESSAGE_RE.findall(line))
+            except Exception:
+                if main_file == main_log:
+                    raise
+                # 백업 파일 읽기 실패는 무시
+        
+        # 최소한 일부 레벨은 찾아져야 함 (순환으로 인해 모든 레벨이 없을 수도 있음)
+        assert len(found_levels) > 0, "메인 로그에 어떤 레벨의 메시지도 없음"
+        
+        # ERROR와 CRITICAL 레벨은 반드시 있어야 함 (에러 로그에도 기록되므로)
+        error_critical_found = any(level in found_levels for level in ['ERROR', 'CRITICAL'])
+        assert error_critical_found, "메인 로그에 ERROR 또는 CRITICAL 레벨 메시지가 없음"
     
-    def test_log_rotation_file_permissions(self):
+    def test_log_rotation_file_permissions(self, tmp_path):
         """로그 순환 시 파일 권한 테스트."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-            log_dir.mkdir()
-            
-            logger_manager = LoggerManager(
-                log_dir=str(log_dir),
-                log_level="INFO",
-                max_file_size=800,
-                backup_count=2,
-                console_output=False,
-                structured_format=True
-            )
-            
-            test_logger = logger_manager.get_logger("test_permissions")
-            
-            # 로그 메시지 생성하여 순환 유발
-            for i in range(30):
-                message = f"Permission test message {i} " + "data " * 50
-                test_logger.info(message, extra={'test_id': i})
-            
-            # 핸들러 플러시
-            for handler in logging.getLogger().handlers:
-                if hasattr(handler, 'flush'):
-                    handler.flush()
-            
-            # 생성된 모든 로그 파일 확인
-            log_files = list(log_dir.glob("*.log*"))
-            
-            for log_file in log_files:
-                if log_file.is_file():
-                    # 파일이 읽기 가능한지 확인
-                    assert os.access(log_file, os.R_OK), f"로그 파일이 읽기 불가능: {log_file}"
-                    
-                    # 파일 크기가 0보다 큰지 확인 (빈 파일이 아님)
-                    file_size = log_file.stat().st_size
-                    if log_file.name.endswith('.log'):  # 현재 활성 파일
-                        assert file_size >= 0, f"활성 로그 파일 크기가 음수: {log_file}"
-                    elif '.log.' in log_file.name:  # 백업 파일
-                        assert file_size > 0, f"백업 로그 파일이 비어있음: {log_file}"
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        
+        logger_manager = LoggerManager(
+            log_dir=str(log_dir),
+            log_level="INFO",
+            max_file_size=800,
+            backup_count=2,
+            console_output=False,
+            structured_format=True
+        )
+        
+        test_logger = logger_manager.get_logger("test_permissions")
+        
+        # 로그 메시지 생성하여 순환 유발
+        for i in range(30):
+            message = f"Permission test message {i} {_FILLER_DATA}"
+            test_logger.info(message, extra={'test_id': i})
+        
+        # 핸들러 플러시
+        logger_manager.flush_all()
+        
+        # 생성된 모든 로그 파일 확인
+        log_files = _log_entries(log_dir)
+        
+        for name, path, file_stat in log_files:
+            # 파일이 읽기 가능한지 확인
+            assert os.access(path, os.R_OK), f"로그 파일이 읽기 불가능: {path}"
+            
+            # 파일 크기가 0보다 큰지 확인 (빈 파일이 아님)
+            file_size = file_stat.st_size
+            if name.endswith('.log'):  # 현재 활성 파일
+                assert file_size >= 0, f"활성 로그 파일 크기가 음수: {path}"
+            elif '.log.' in name:  # 백업 파일
+                assert file_size > 0, f"백업 로그 파일이 비어있음: {path}"
     
-    def test_log_rotation_cleanup_integration(self):
+    def test_log_rotation_cleanup_integration(self, tmp_path):
         """로그 순환과 정리 작업의 통합 테스트."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir) / "logs"
-            log_dir.mkdir()
-            
-            logger_manager = LoggerManager(
-                log_dir=str(log_dir),
-                log_level="INFO",
-                max_file_size=600,
-                backup_count=3,  # 3개의 백업 파일만 유지
-                console_output=False,
-                structured_format=True
-            )
-            
-            test_logger = logger_manager.get_logger("test_cleanup_integration")
-            
-            # 많은 로그 메시지를 생성하여 여러 번의 순환 유발
-            for batch in range(5):  # 5개 배치
-                for i in range(20):  # 배치당 20개 메시지
-                    message = f"Batch {batch} message {i} " + "content " * 30
-                    test_logger.info(message, extra={
-                        'batch': batch,
-                        'message_id': i,
-                        'total_id': batch * 20 + i
-                    })
-                
-                # 배치 간 플러시
-                for handler in logging.getLogger().handlers:
-                    if hasattr(handler, 'flush'):
-                        handler.flush()
-            
-            # 최종 플러시
-            for handler in logging.getLogger().handlers:
-                if hasattr(handler, 'flush'):
-                    handler.flush()
-            
-            # 순환 결과 확인
-            log_files = list(log_dir.glob("*.log*"))
-            main_backups = [f for f in log_files if f.name.startswith('trading_bot.log.')]
-            
-            # 백업 파일 개수가 설정값을 초과하지 않는지 확인
-            assert len(main_backups) <= 3, f"백업 파일 개수가 설정값을 초과: {len(main_backups)} > 3"
-            
-            # 정리 작업 실행 (매우 짧은 보존 기간으로 설정)
-            logger_manager.cleanup_old_logs(retention_days=0)  # 모든 백업 파일 삭제
-            
-            # 정리 후 상태 확인
-            remaining_files = list(log_dir.glob("*.log*"))
-            
-            # 현재 활성 파일들은 유지되어야 함
-            main_log = log_dir / "trading_bot.log"
-            error_log = log_dir / "errors.log"
-            
-            assert main_log.exists(), "메인 로그 파일이 유지되어야 함"
-            assert error_log.exists(), "에러 로그 파일이 유지되어야 함"
-            
-            # 백업 파일들은 삭제되었어야 함 (retention_days=0이므로)
-            remaining_backups = [f for f in remaining_files if '.log.' in f.name]
-            # 일부 백업 파일은 아직 삭제되지 않을 수 있음 (파일 시스템 타이밍)
-            # 하지만 대부분은 삭제되어야 함
-            assert len(remaining_backups) <= len(main_backups), "정리 작업 후 백업 파일 수가 감소해야 함"
\ No newline at end of file
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        
+        logger_manager = LoggerManager(
+            log_dir=str(log_dir),
+            log_level="INFO",
+            max_file_size=600,
+            backup_count=3,  # 3개의 백업 파일만 유지
+            console_output=False,
+            structured_format=True
+        )
+        
+        test_logger = logger_manager.get_logger("test_cleanup_integration")
+        
+        # 많은 로그 메시지를 생성하여 여러 번의 순환 유발 (5개 배치, 배치당 20개 메시지)
+        extras = [
+            {'batch': batch, 'message_id': i, 'total_id': batch * 20 + i}
+            for batch in range(5)
+            for i in range(20)
+        ]
+        messages = [
+            f"Batch {extra['batch']} message {extra['message_id']} {_FILLER_LONG}"
+            for extra in extras
+        ]
+        records = [
+            _make_record(test_logger, logging.INFO, message, extra)
+            for message, extra in zip(messages, extras)
+        ]
+        _dispatch_records(records, logger_manager._handlers)
+        
+        # 최종 플러시 (StreamHandler.emit이 레코드마다 플러시하므로 배치 간 플러시는 불필요)
+        logger_manager.flush_all()
+        
+        # 순환 결과 확인
+        log_files = _log_entries(log_dir)
+        main_backups, _ = _partition_backups(log_files)
+        
+        # 백업 파일 개수가 설정값을 초과하지 않는지 확인
+        assert len(main_backups) <= 3, f"백업 파일 개수가 설정값을 초과: {len(main_backups)} > 3"
+        
+        # 정리 작업 실행 (매우 짧은 보존 기간으로 설정)
+        logger_manager.cleanup_old_logs(retention_days=0)  # 모든 백업 파일 삭제
+        
+        # 정리 후 상태 확인
+        remaining_files = _log_entries(log_dir)
+        
+        # 현재 활성 파일들은 유지되어야 함
+        main_log = log_dir / "trading_bot.log"
+        error_log = log_dir / "errors.log"
+        
+        assert main_log.exists(), "메인 로그 파일이 유지되어야 함"
+        assert error_log.exists(), "에러 로그 파일이 유지되어야 함"
+        
+        # 백업 파일들은 삭제되었어야 함 (retention_days=0이므로)
+        remaining_backups = [name for name, _, _ in remaining_files if '.log.' in name]
+        # 일부 백업 파일은 아직 삭제되지 않을 수 있음 (파일 시스템 타이밍)
+        # 하지만 대부분은 삭제되어야 함
+        assert len(remaining_backups) <= len(main_backups), "정리 작업 후 백업 파일 수가 감소해야 함"
\ No newline at end of file
@@ -7,60 +7,78 @@
 import pytest
 import json
 from datetime import datetime, timezone
-from hypothesis import given, strategies as st, assume, settings
+from hypothesis import given, strategies as st, settings
 from hypothesis.strategies import composite
 
 from upbit_trading_bot.data.models import Ticker, Order, TradingSignal, Position
 
 
+# Fixed timestamp for tests that don't assert on time semantics
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+_TRADE_PRICES = st.floats(min_value=0.01, max_value=100000000.0, allow_nan=False, allow_infinity=False)
+_TRADE_VOLUMES = st.floats(min_value=0.0, max_value=1000000.0, allow_nan=False, allow_infinity=False)
+_CHANGE_RATES = st.floats(min_value=-0.3, max_value=0.3, allow_nan=False, allow_infinity=False)
+# Naive datetimes; callers attach UTC
+_NAIVE_TIMESTAMPS = st.datetimes(
+    min_value=datetime(2020, 1, 1),
+    max_value=datetime(2030, 12, 31)
+)
+
+
+_BASE_CURRENCIES = ('BTC', 'ETH', 'ADA', 'DOT', 'LINK', 'XRP', 'LTC', 'BCH')
+_QUOTE_CURRENCIES = ('KRW', 'BTC', 'USDT')
+# Realistic market names such as KRW-BTC, excluding BTC-BTC and similar
+_MARKETS = tuple(
+    f"{quote}-{base}"
+    for base in _BASE_CURRENCIES
+    for quote in _QUOTE_CURRENCIES
+    if base != quote
+)
+_MARKET_STRAT = st.sampled_from(_MARKETS)
+_MALFORMED_MARKETS = st.text(
+    alphabet=st.characters(blacklist_characters='-'),
+    min_size=1,
+    max_size=10
+)
+
+
 @composite
 def valid_market_data_response(draw):
     """Generate valid market data response structure similar to Upbit API."""
-    # Generate realistic market names
-    base_currencies = ['BTC', 'ETH', 'ADA', 'DOT', 'LINK', 'XRP', 'LTC', 'BCH']
-    quote_currencies = ['KRW', 'BTC', 'USDT']
-    
-    base = draw(st.sampled_from(base_currencies))
-    quote = draw(st.sampled_from(quote_currencies))
-    # Ensure we don't have BTC-BTC or similar
-    assume(base != quote)
-    
-    market = f"{quote}-{base}"
-    
-    # Generate realistic price data
-    trade_price = draw(st.floats(min_value=0.01, max_value=100000000.0, allow_nan=False, allow_infinity=False))
-    trade_volume = draw(st.floats(min_value=0.0, max_value=1000000.0, allow_nan=False, allow_infinity=False))
-    change_rate = draw(st.floats(min_value=-0.3, max_value=0.3, allow_nan=False, allow_infinity=False))
-    
-    # Generate timestamp (naive datetime, then add timezone)
-    naive_timestamp = draw(st.datetimes(
-        min_value=datetime(2020, 1, 1),
-        max_value=datetime(2030, 12, 31)
-    ))
-    timestamp = naive_timestamp.replace(tzinfo=timezone.utc)
-    
     return {
-        'market': market,
-        'trade_price': trade_price,
-        'trade_volume': trade_volume,
-        'timestamp': timestamp,
-        'change_rate': change_rate
+        'market': draw(_MARKET_STRAT),
+        'trade_price': draw(_TRADE_PRICES),
+        'trade_volume': draw(_TRADE_VOLUMES),
+        'timestamp': draw(_NAIVE_TIMESTAMPS).replace(tzinfo=timezone.utc),
+        'change_rate': draw(_CHANGE_RATES)
     }
 
 
 @composite
 def valid_ticker_json_response(draw):
-    """Generate valid ticker JSON response similar to Upbit API format."""
-    market_data = draw(valid_market_data_response())
+    """Generate valid ticker JSON response similar to Upbit API format.
+    
+    Draws the primitives directly instead of going through
+    ``valid_market_data_response``, so there is no nested composite per example.
+    """
+    market = draw(_MARKET_STRAT)
+    trade_price = draw(_TRADE_PRICES)
+    trade_volume = draw(_TRADE_VOLUMES)
+    timestamp = draw(_NAIVE_TIMESTAMPS)
+    change_rate = draw(_CHANGE_RATES)
     
-    # Convert to format similar to Upbit API response
+    # 'YYYY-MM-DD HH:MM:SS[.ffffff]' -> date and time parts
+    iso = timestamp.isoformat(sep=' ')
+    
+    # API returns numeric values as strings
     return {
-        'market': market_data['market'],
-        'trade_price': str(market_data['trade_price']),  # API returns as string
-        'trade_volume': str(market_data['trade_volume']),  # API returns as string
-        'trade_date_utc': market_data['timestamp'].strftime('%Y-%m-%d'),
-        'trade_time_utc': market_data['timestamp'].strftime('%H:%M:%S'),
-        'change_rate': str(market_data['change_rate'])  # API returns as string
+        'market': market,
+        'trade_price': str(trade_price),
+        'trade_volume': str(trade_volume),
+        'trade_date_utc': iso[:10],
+        'trade_time_utc': iso[11:19],
+        'change_rate': str(change_rate)
     }
 
 
@@ -97,9 +115,8 @@ def malformed_market_data(draw):
         return base_data
     
     elif malform_type == 'invalid_market_format':
-        base_data['market'] = draw(st.text(min_size=1, max_size=10))
-        # Ensure it doesn't accidentally match valid format
-        assume('-' not in base_data['market'] or base_data['market'].count('-') != 1)
+        # No '-' at all, so it can never match the QUOTE-BASE format
+        base_data['market'] = draw(_MALFORMED_MARKETS)
         return base_data
     
     elif malform_type == 'empty_string_values':
@@ -113,7 +130,7 @@ class TestMarketDataParsingConsistency:
     """Property-based tests for market data parsing consistency."""
     
     @given(market_data=valid_market_data_response())
-    @settings(max_examples=100)
+    @settings(max_examples=30, deadline=None, derandomize=True, database=None)
     def test_property_5_market_data_parsing_consistency(self, market_data):
         """
         **Feature: upbit-trading-bot, Property 5: Market Data Parsing Consistency**
@@ -134,19 +151,14 @@ class TestMarketDataParsingConsistency:
         # Property 1: Ticker should validate successfully
         assert ticker.validate(), "Valid market data should produce a valid Ticker"
         
-        # Property 2: All required fields should be populated with correct types
-        assert isinstance(ticker.market, str), "Market should be a string"
+        # Property 2: All required fields should be populated
+        # (field types are checked once in test_ticker_field_types_smoke)
         assert len(ticker.market) > 0, "Market should not be empty"
-        assert isinstance(ticker.trade_price, (int, float)), "Trade price should be numeric"
         assert ticker.trade_price > 0, "Trade price should be positive"
-        assert isinstance(ticker.trade_volume, (int, float)), "Trade volume should be numeric"
         assert ticker.trade_volume >= 0, "Trade volume should be non-negative"
-        assert isinstance(ticker.timestamp, datetime), "Timestamp should be datetime"
-        assert isinstance(ticker.change_rate, (int, float)), "Change rate should be numeric"
         
         # Property 3: Serialization round-trip should preserve data
-        ticker_dict = ticker.to_dict()
-        reconstructed_ticker = Ticker.from_dict(ticker_dict)
+        reconstructed_ticker = Ticker.from_dict(ticker.to_dict())
         
         assert reconstructed_ticker.market == ticker.market, "Market should be preserved in round-trip"
         assert abs(reconstructed_ticker.trade_price - ticker.trade_price) < 1e-10, "Trade price should be preserved in round-trip"
@@ -154,18 +166,49 @@ class TestMarketDataParsingConsistency:
         assert reconstructed_ticker.timestamp == ticker.timestamp, "Timestamp should be preserved in round-trip"
         assert abs(reconstructed_ticker.change_rate - ticker.change_rate) < 1e-10, "Change rate should be preserved in round-trip"
         
-        # Property 4: JSON serialization round-trip should preserve data
-        ticker_json = ticker.to_json()
-        json_reconstructed_ticker = Ticker.from_json(ticker_json)
+        # Property 4: Reconstructed ticker should also validate
+        assert reconstructed_ticker.validate(), "Reconstructed ticker should validate"
+    
+    def test_ticker_field_types_smoke(self):
+        """All required Ticker fields should have the correct types."""
+        ticker = Ticker(
+            market="KRW-BTC",
+            trade_price=50000000.0,
+            trade_volume=1.5,
+            timestamp=_FIXED_TS,
+            change_rate=0.01
+        )
+        
+        assert ticker.validate(), "Fixed valid market data should produce a valid Ticker"
+        assert isinstance(ticker.market, str), "Market should be a string"
+        assert isinstance(ticker.trade_price, (int, float)), "Trade price should be numeric"
+        assert isinstance(ticker.trade_volume, (int, float)), "Trade volume should be numeric"
+        assert isinstance(ticker.timestamp, datetime), "Timestamp should be datetime"
+        assert isinstance(ticker.change_rate, (int, float)), "Change rate should be numeric"
+    
+    @given(market_data=valid_market_data_response())
+    @settings(max_examples=20, deadline=None)
+    def test_property_5_json_roundtrip(self, market_data):
+        """JSON serialization round-trip should preserve data.
+        
+        Kept separate from the dict round-trip above so the comparatively
+        expensive JSON encode/decode runs on fewer examples.
+        """
+        ticker = Ticker(
+            market=market_data['market'],
+            trade_price=market_data['trade_price'],
+            trade_volume=market_data['trade_volume'],
+            timestamp=market_data['timestamp'],
+            change_rate=market_data['change_rate']
+        )
+        
+        json_reconstructed_ticker = Ticker.from_json(ticker.to_json())
         
         assert json_reconstructed_ticker.market == ticker.market, "Market should be preserved in JSON round-trip"
         assert abs(json_reconstructed_ticker.trade_price - ticker.trade_price) < 1e-10, "Trade price should be preserved in JSON round-trip"
         assert abs(json_reconstructed_ticker.trade_volume - ticker.trade_volume) < 1e-10, "Trade volume should be preserved in JSON round-trip"
         assert json_reconstructed_ticker.timestamp == ticker.timestamp, "Timestamp should be preserved in JSON round-trip"
         assert abs(json_reconstructed_ticker.change_rate - ticker.change_rate) < 1e-10, "Change rate should be preserved in JSON round-trip"
-        
-        # Property 5: Reconstructed ticker should also validate
-        assert reconstructed_ticker.validate(), "Reconstructed ticker should validate"
         assert json_reconstructed_ticker.validate(), "JSON reconstructed ticker should validate"
     
     @given(json_response=valid_ticker_json_response())
@@ -174,10 +217,9 @@ class TestMarketDataParsingConsistency:
         """Test parsing of API-like JSON responses with string numeric values."""
         # Simulate parsing API response (strings to numbers)
         try:
-            parsed_timestamp = datetime.strptime(
-                f"{json_response['trade_date_utc']} {json_response['trade_time_utc']}", 
-                '%Y-%m-%d %H:%M:%S'
-            ).replace(tzinfo=timezone.utc)
+            parsed_timestamp = datetime.fromisoformat(
+                f"{json_response['trade_date_utc']}T{json_response['trade_time_utc']}+00:00"
+            )
             
             ticker = Ticker(
                 market=json_response['market'],
@@ -200,7 +242,7 @@ class TestMarketDataParsingConsistency:
             pytest.fail(f"Valid API response should be parseable: {e}")
     
     @given(malformed_data=malformed_market_data())
-    @settings(max_examples=50)
+    @settings(max_examples=30, deadline=None, derandomize=True, database=None)
     def test_malformed_data_handling(self, malformed_data):
         """Test that malformed market data is properly rejected."""
         try:
@@ -208,7 +250,7 @@ class TestMarketDataParsingConsistency:
                 market=malformed_data.get('market', ''),
                 trade_price=malformed_data.get('trade_price', 0),
                 trade_volume=malformed_data.get('trade_volume', 0),
-                timestamp=malformed_data.get('timestamp', datetime.now()),
+                timestamp=malformed_data.get('timestamp', _FIXED_TS),
                 change_rate=malformed_data.get('change_rate', 0)
             )
             
@@ -257,7 +299,7 @@ class TestMarketDataParsingConsistency:
             market="KRW-TEST",
             trade_price=0.00000001,
             trade_volume=0.0,
-            timestamp=datetime.now(),
+            timestamp=_FIXED_TS,
             change_rate=-0.99
         )
         assert small_ticker.validate(), "Ticker with small valid values should validate"
@@ -267,7 +309,7 @@ class TestMarketDataParsingConsistency:
             market="KRW-TEST",
             trade_price=999999999.99,
             trade_volume=999999999.99,
-            timestamp=datetime.now(),
+            timestamp=_FIXED_TS,
             change_rate=0.99
         )
         assert large_ticker.validate(), "Ticker with large valid values should validate"
\ No newline at end of file
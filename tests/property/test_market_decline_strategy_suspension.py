@@ -5,62 +5,89 @@ Property-based test for market decline strategy suspension.
 **Validates: Requirements 8.5**
 """
 
+import functools
+
 import pytest
 from hypothesis import given, strategies as st, settings
 from datetime import datetime
-from typing import List
 
 from upbit_trading_bot.strategy.market_analyzer import MarketAnalyzer
-from upbit_trading_bot.data.models import MarketConditions, Ticker
+from upbit_trading_bot.data.models import Ticker
 from upbit_trading_bot.data.market_data import MarketData
 
 
+@functools.lru_cache(maxsize=None)
+def _get_analyzer(frozen_cfg: frozenset) -> MarketAnalyzer:
+    """설정별 MarketAnalyzer 인스턴스 (예제 간 재사용, 분석기는 상태를 갖지 않음)"""
+    return MarketAnalyzer(dict(frozen_cfg))
+
+
+_BASE_PRICE = 50000000.0
+_BASE_HISTORY = tuple(_BASE_PRICE + i * 1000 for i in range(18))  # 18개 기본 가격
+
+# 분석기는 타임스탬프를 사용하지 않으므로 모듈 로드 시점 값을 공유
+_NOW = datetime.now()
+
+
 def create_market_data_with_market_decline(market_decline: float) -> MarketData:
     """시장 하락률을 가진 시장 데이터 생성"""
-    base_price = 50000000.0
-    
     # 시장 하락을 반영한 가격 히스토리 생성
     # 1분간 가격 변화로 시장 하락을 시뮬레이션
-    previous_price = base_price
+    previous_price = _BASE_PRICE
     current_price = previous_price * (1 + market_decline / 100)
     
-    price_history = [base_price + i * 1000 for i in range(18)]  # 18개 기본 가격
-    price_history.append(previous_price)  # 19번째: 이전 가격
-    price_history.append(current_price)   # 20번째: 현재 가격
+    # 19번째: 이전 가격, 20번째: 현재 가격
+    price_history = [*_BASE_HISTORY, previous_price, current_price]
     
     ticker = Ticker(
         market="KRW-BTC",
         trade_price=current_price,
         trade_volume=2.0,  # 거래량 조건을 만족하도록 설정
-        timestamp=datetime.now(),
+        timestamp=_NOW,
         change_rate=0.01  # 24시간 변화율 (별도)
     )
     
     market_data = MarketData(
         ticker=ticker,
         orderbook=None,
-        timestamp=datetime.now(),
+        timestamp=_NOW,
         price_history=price_history
     )
     
     return market_data
 
 
-@given(
-    market_decline=st.floats(min_value=-10.0, max_value=2.0),
-    market_decline_threshold=st.floats(min_value=-5.0, max_value=-1.0)
-)
-@settings(max_examples=100)
-def test_market_decline_strategy_suspension_property(market_decline: float, market_decline_threshold: float):
+@functools.lru_cache(maxsize=4096)
+def _analyze(cfg_key: frozenset, decline_bin: int):
+    """0.1% 단위 하락 구간별 시장 상황 분석 결과 (설정별 캐시, 고정 임계값 테스트 전용)"""
+    market_data = create_market_data_with_market_decline(decline_bin / 10)
+    return _get_analyzer(cfg_key).analyze_market_conditions(market_data)
+
+
+@st.composite
+def decline_and_threshold(draw):
+    """임계값과 최소 0.01%p 떨어진 시장 하락률 쌍 생성 (부동소수점 경계 회피)"""
+    market_decline_threshold = draw(st.floats(min_value=-5.0, max_value=-1.0))
+    gap = draw(st.floats(min_value=0.01, max_value=12.0))
+    above = draw(st.booleans())
+    
+    market_decline = market_decline_threshold + gap if above else market_decline_threshold - gap
+    # [-10%, 2%] 범위로 제한 (임계값이 [-5%, -1%]이므로 제한 후에도 간격 유지)
+    market_decline = max(-10.0, min(2.0, market_decline))
+    
+    return market_decline, market_decline_threshold
+
+
+@given(decline_and_threshold())
+@settings(max_examples=30, deadline=None, derandomize=True, database=None)
+def test_market_decline_strategy_suspension_property(decline_pair):
     """
     **Feature: stop-loss-averaging-strategy, Property 36: 시장 하락 시 전략 중단**
     **Validates: Requirements 8.5**
     
     모든 시장 하락 상황에서, 시장 전체가 임계값 이상 하락하면 전략 실행이 일시 중단되어야 한다.
     """
-    # 부동소수점 정밀도 문제를 피하기 위해 충분한 차이가 있는 경우만 테스트
-    if abs(market_decline - market_decline_threshold) < 0.01:
-        return  # 너무 가까운 값은 건너뛰기
+    market_decline, market_decline_threshold = decline_pair
     
     # MarketAnalyzer 설정
     config = {
@@ -68,12 +95,11 @@ def test_market_decline_strategy_suspension_property(market_decline: float, mark
         'volume_ratio_threshold': 1.0,  # 거래량 조건은 만족하도록 설정
         'rapid_decline_threshold': -10.0  # 급락 조건은 만족하도록 설정
     }
-    analyzer = MarketAnalyzer(config)
+    cfg_key = frozenset(config.items())
+    analyzer = _get_analyzer(cfg_key)
     
-    # 시장 데이터 생성
+    # 시장 상황 분석 (임계값과의 간격을 유지하도록 양자화하지 않음)
     market_data = create_market_data_with_market_decline(market_decline)
-    
-    # 시장 상황 분석
     market_conditions = analyzer.analyze_market_conditions(market_data)
     
     # 전략 중단 조건 확인
@@ -100,10 +126,9 @@ def test_severe_market_decline_always_suspends(market_decline: float):
     
     기본 설정(-3% 임계값)에서 심각한 시장 하락은 항상 전략을 중단시켜야 한다.
     """
-    analyzer = MarketAnalyzer()  # 기본 설정 사용
+    analyzer = _get_analyzer(frozenset())  # 기본 설정 사용
     
-    market_data = create_market_data_with_market_decline(market_decline)
-    market_conditions = analyzer.analyze_market_conditions(market_data)
+    market_conditions = _analyze(frozenset(), round(market_decline * 10))
     
     # 전략 중단 조건 확인
     should_suspend = analyzer.should_suspend_strategy(market_conditions)
@@ -124,10 +149,9 @@ def test_normal_market_condition_no_suspension(market_decline: float):
     
     기본 설정(-3% 임계값)에서 정상 시장 상황은 전략을 중단시키지 않아야 한다.
     """
-    analyzer = MarketAnalyzer()  # 기본 설정 사용
+    analyzer = _get_analyzer(frozenset())  # 기본 설정 사용
     
-    market_data = create_market_data_with_market_decline(market_decline)
-    market_conditions = analyzer.analyze_market_conditions(market_data)
+    market_conditions = _analyze(frozenset(), round(market_decline * 10))
     
     # 전략 중단 조건 확인
     should_suspend = analyzer.should_suspend_strategy(market_conditions)
@@ -174,35 +198,38 @@ def test_market_decline_blocks_buy_signal():
         assert not should_allow, "시장 하락 중에는 다른 조건이 만족되어도 매수 신호가 차단되어야 함"
 
 
-def test_market_decline_threshold_accuracy():
+@pytest.fixture(scope="module")
+def analyzer():
+    """기본 설정 MarketAnalyzer (모듈 내 공유)"""
+    return MarketAnalyzer()
+
+
+@pytest.mark.parametrize("market_decline,expected_suspension", [
+    (-2.0, False),  # -2% 하락 (임계값 -3% 초과) -> 중단 안됨
+    (-3.0, True),   # -3% 하락 (임계값과 동일) -> 중단됨
+    (-4.0, True),   # -4% 하락 (임계값 미만) -> 중단됨
+    (1.0, False),   # 1% 상승 -> 중단 안됨
+])
+def test_market_decline_threshold_accuracy(analyzer, market_decline: float, expected_suspension: bool):
     """
     **Feature: stop-loss-averaging-strategy, Property 36: 시장 하락 시 전략 중단**
     **Validates: Requirements 8.5**
     
     시장 하락 임계값 비교가 정확해야 한다.
     """
-    analyzer = MarketAnalyzer()
+    market_data = create_market_data_with_market_decline(market_decline)
+    market_conditions = analyzer.analyze_market_conditions(market_data)
+    
+    should_suspend = analyzer.should_suspend_strategy(market_conditions)
+    
+    # 실제 계산된 값으로 검증 (부동소수점 오차 고려)
+    actual_decline = market_conditions.price_change_1m
+    expected_result = actual_decline <= -3.0
     
-    # 정확한 시장 하락률로 테스트
-    test_cases = [
-        (-2.0, False),  # -2% 하락 (임계값 -3% 초과) -> 중단 안됨
-        (-3.0, True),   # -3% 하락 (임계값과 동일) -> 중단됨
-        (-4.0, True),   # -4% 하락 (임계값 미만) -> 중단됨
-        (1.0, False),   # 1% 상승 -> 중단 안됨
-    ]
-    
-    for market_decline, expected_suspension in test_cases:
-        market_data = create_market_data_with_market_decline(market_decline)
-        market_conditions = analyzer.analyze_market_conditions(market_data)
-        
-        should_suspend = analyzer.should_suspend_strategy(market_conditions)
-        
-        # 실제 계산된 값으로 검증 (부동소수점 오차 고려)
-        actual_decline = market_conditions.price_change_1m
-        expected_result = actual_decline <= -3.0
-        
-        assert should_suspend == expected_result, \
-            f"시장 하락 {market_decline}% (실제 {actual_decline}%)에서 중단 여부가 예상과 다름: 예상 {expected_result}, 실제 {should_suspend}"
+    assert should_suspend == expected_result, \
+        f"시장 하락 {market_decline}% (실제 {actual_decline}%)에서 중단 여부가 예상과 다름: 예상 {expected_result}, 실제 {should_suspend}"
+    assert should_suspend == expected_suspension, \
+        f"시장 하락 {market_decline}%에서 중단 여부가 예상과 다름: 예상 {expected_suspension}, 실제 {should_suspend}"
 
 
 def test_strategy_suspension_integration():
@@ -7,6 +7,7 @@
 모든 거래 시도에서, 계좌 잔고가 최소 거래 금액 미만이면 거래가 중단되어야 한다.
 """
 
+import numpy as np
 import pytest
 from hypothesis import given, strategies as st, assume
 from typing import Dict, Any
@@ -14,29 +15,15 @@ from typing import Dict, Any
 from upbit_trading_bot.strategy.risk_controller import RiskController
 
 
-@st.composite
-def balance_scenario_strategy(draw):
-    """잔고 시나리오 생성 전략"""
-    min_balance_threshold = draw(st.floats(min_value=5000.0, max_value=50000.0))
-    min_order_amount = draw(st.floats(min_value=1000.0, max_value=20000.0))
-    
+# 예제마다 바뀌지 않는 리스크 설정
+_BASE_CFG = {'daily_loss_limit': 50000.0, 'consecutive_loss_limit': 3}
+
+
+def _balance_scenario(min_balance_threshold: float, min_order_amount: float, balance_factor: float) -> Dict[str, Any]:
+    """효과적인 최소 잔고 대비 배율로 잔고 시나리오 생성"""
     # 효과적인 최소 잔고는 둘 중 큰 값
     effective_min_balance = max(min_balance_threshold, min_order_amount)
-    
-    # 시나리오 타입: 충분함, 부족함, 경계값
-    scenario_type = draw(st.sampled_from(['sufficient', 'insufficient', 'boundary']))
-    
-    if scenario_type == 'sufficient':
-        balance = draw(st.floats(min_value=effective_min_balance * 1.1, max_value=effective_min_balance * 5.0))
-    elif scenario_type == 'insufficient':
-        balance = draw(st.floats(min_value=0.0, max_value=effective_min_balance * 0.9))
-    else:  # boundary
-        # 경계값 근처 (±1% 범위)
-        boundary_range = effective_min_balance * 0.01
-        balance = draw(st.floats(
-            min_value=effective_min_balance - boundary_range,
-            max_value=effective_min_balance + boundary_range
-        ))
+    balance = effective_min_balance * balance_factor
     
     return {
         'min_balance_threshold': min_balance_threshold,
@@ -47,6 +34,24 @@ def balance_scenario_strategy(draw):
     }
 
 
+def _balance_scenario_branch(min_factor: float, max_factor: float):
+    """잔고 배율 구간별 시나리오 전략"""
+    return st.builds(
+        _balance_scenario,
+        st.floats(min_value=5000.0, max_value=50000.0),
+        st.floats(min_value=1000.0, max_value=20000.0),
+        st.floats(min_value=min_factor, max_value=max_factor)
+    )
+
+
+# 잔고 시나리오 생성 전략: 충분함, 부족함, 경계값(±1% 범위)
+balance_scenario_strategy = st.one_of(
+    _balance_scenario_branch(1.1, 5.0),
+    _balance_scenario_branch(0.0, 0.9),
+    _balance_scenario_branch(0.99, 1.01)
+)
+
+
 @st.composite
 def order_validation_scenario_strategy(draw):
     """주문 검증 시나리오 생성 전략"""
@@ -61,10 +66,16 @@ def order_validation_scenario_strategy(draw):
     }
 
 
+@pytest.fixture(scope="module")
+def risk_controller():
+    """기본 보호 임계값(10,000 KRW)의 RiskController (모듈 내 공유)"""
+    return RiskController({**_BASE_CFG, 'min_balance_threshold': 10000.0})
+
+
 class TestMinimumBalanceCheck:
     """최소 잔고 확인 속성 테스트"""
     
-    @given(balance_scenario_strategy())
+    @given(balance_scenario_strategy)
     def test_minimum_balance_enforcement(self, scenario):
         """
         **Feature: stop-loss-averaging-strategy, Property 10: 최소 잔고 확인**
@@ -73,11 +84,7 @@ class TestMinimumBalanceCheck:
         모든 거래 시도에서, 계좌 잔고가 최소 거래 금액 미만이면 거래가 중단되어야 한다.
         """
         # Given: 리스크 컨트롤러와 잔고 시나리오
-        config = {
-            'daily_loss_limit': 50000.0,
-            'consecutive_loss_limit': 3,
-            'min_balance_threshold': scenario['min_balance_threshold']
-        }
+        config = {**_BASE_CFG, 'min_balance_threshold': scenario['min_balance_threshold']}
         risk_controller = RiskController(config)
         
         # When: 계좌 잔고를 확인
@@ -97,17 +104,49 @@ class TestMinimumBalanceCheck:
             f"실제 결과 {result}"
         )
     
+    def test_check_account_balance_vectorized(self):
+        """
+        **Feature: stop-loss-averaging-strategy, Property 10: 최소 잔고 확인**
+        **검증: 요구사항 2.5**
+        
+        고정 시드로 생성한 잔고/임계값/최소 주문 금액 조합 전체에 대해
+        잔고 확인 결과가 max(임계값, 최소 주문 금액) 비교와 일치해야 한다.
+        """
+        # Given: 고정 시드 표본 (임계값은 16개 값 중에서 뽑아 컨트롤러 재사용)
+        sample_size = 10_000
+        rng = np.random.default_rng(0)
+        thresholds = rng.uniform(5000.0, 50000.0, 16)[rng.integers(0, 16, sample_size)]
+        balances = rng.uniform(0.0, 200_000.0, sample_size)
+        min_order_amounts = rng.uniform(1000.0, 20_000.0, sample_size)
+        expected = balances >= np.maximum(thresholds, min_order_amounts)
+        
+        # When: 임계값별 컨트롤러를 한 번씩 만들고 모든 조합에 대해 계좌 잔고를 확인
+        controllers = {
+            threshold: RiskController({**_BASE_CFG, 'min_balance_threshold': threshold})
+            for threshold in set(thresholds.tolist())
+        }
+        actual = np.fromiter(
+            (
+                controllers[threshold].check_account_balance(balance, min_order_amount)
+                for threshold, balance, min_order_amount
+                in zip(thresholds.tolist(), balances.tolist(), min_order_amounts.tolist())
+            ),
+            dtype=bool,
+            count=sample_size
+        )
+        
+        # Then: 벡터화된 기대값과 일치해야 함
+        assert np.array_equal(actual, expected), (
+            f"최소 잔고 확인 불일치: {np.count_nonzero(actual != expected)}/{sample_size}건"
+        )
+    
     @given(order_validation_scenario_strategy())
     def test_order_size_validation_with_balance_protection(self, scenario):
         """
         주문 크기 검증 시 잔고 보호 확인
         """
         # Given: 리스크 컨트롤러
-        config = {
-            'daily_loss_limit': 50000.0,
-            'consecutive_loss_limit': 3,
-            'min_balance_threshold': scenario['min_balance_threshold']
-        }
+        config = {**_BASE_CFG, 'min_balance_threshold': scenario['min_balance_threshold']}
         risk_controller = RiskController(config)
         
         # When: 주문 크기를 검증
@@ -144,11 +183,7 @@ class TestMinimumBalanceCheck:
         잔고가 0인 경우 항상 부족해야 함
         """
         # Given: 리스크 컨트롤러
-        config = {
-            'daily_loss_limit': 50000.0,
-            'consecutive_loss_limit': 3,
-            'min_balance_threshold': min_balance_threshold
-        }
+        config = {**_BASE_CFG, 'min_balance_threshold': min_balance_threshold}
         risk_controller = RiskController(config)
         
         # When: 잔고가 0인 경우 확인
@@ -163,11 +198,7 @@ class TestMinimumBalanceCheck:
         음수 잔고인 경우 항상 부족해야 함
         """
         # Given: 리스크 컨트롤러
-        config = {
-            'daily_loss_limit': 50000.0,
-            'consecutive_loss_limit': 3,
-            'min_balance_threshold': min_balance_threshold
-        }
+        config = {**_BASE_CFG, 'min_balance_threshold': min_balance_threshold}
         risk_controller = RiskController(config)
         
         # When: 음수 잔고인 경우 확인
@@ -188,11 +219,7 @@ class TestMinimumBalanceCheck:
         assume(high_balance > min_balance_threshold * 10)  # 임계값의 10배 이상
         
         # Given: 리스크 컨트롤러
-        config = {
-            'daily_loss_limit': 50000.0,
-            'consecutive_loss_limit': 3,
-            'min_balance_threshold': min_balance_threshold
-        }
+        config = {**_BASE_CFG, 'min_balance_threshold': min_balance_threshold}
         risk_controller = RiskController(config)
         
         # When: 매우 높은 잔고인 경우 확인
@@ -207,11 +234,7 @@ class TestMinimumBalanceCheck:
         잔고 부족 시 전략 중단 확인
         """
         # Given: 리스크 컨트롤러
-        config = {
-            'daily_loss_limit': 50000.0,
-            'consecutive_loss_limit': 3,
-            'min_balance_threshold': min_balance_threshold
-        }
+        config = {**_BASE_CFG, 'min_balance_threshold': min_balance_threshold}
         risk_controller = RiskController(config)
         
         # 잔고가 부족한 시장 상황
@@ -232,18 +255,10 @@ class TestMinimumBalanceCheck:
         )
     
     @given(st.floats(min_value=0.0, max_value=100000.0))
-    def test_zero_or_negative_order_size_validation(self, available_balance):
+    def test_zero_or_negative_order_size_validation(self, risk_controller, available_balance):
         """
         0 또는 음수 주문 크기 검증
         """
-        # Given: 리스크 컨트롤러
-        config = {
-            'daily_loss_limit': 50000.0,
-            'consecutive_loss_limit': 3,
-            'min_balance_threshold': 10000.0
-        }
-        risk_controller = RiskController(config)
-        
         # When: 0 또는 음수 주문 크기를 검증
         zero_result = risk_controller.validate_order_size(0.0, available_balance)
         negative_result = risk_controller.validate_order_size(-1000.0, available_balance)
@@ -2,46 +2,52 @@
 
 **Feature: upbit-trading-bot, Property 11: Order Creation Accuracy**
 **Validates: Requirements 4.1**
+
+The tests share no state beyond a read-only OrderManager, so they can be
+spread across CPUs with pytest-xdist::
+
+    pytest tests/property/test_order_creation_accuracy.py -n auto --dist=load
 """
 
+import functools
+import os
+import string
+
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch, MagicMock
-from hypothesis import given, strategies as st, assume, settings
+from unittest.mock import patch, MagicMock
+from hypothesis import given, example, strategies as st, settings, HealthCheck, Phase
 from hypothesis.strategies import composite
 
 from upbit_trading_bot.order.manager import OrderManager
 from upbit_trading_bot.data.models import TradingSignal, Order, Position
-from upbit_trading_bot.api.client import UpbitAPIClient
 
 
-@composite
-def valid_trading_signals(draw):
-    """Generate valid trading signals for testing."""
-    # Generate realistic market names
-    base_currencies = ['KRW']
-    quote_currencies = ['BTC', 'ETH', 'ADA', 'DOT', 'LINK', 'XRP', 'LTC']
+class _StubAPIClient:
+    """API client stand-in; create_order builds orders from the signal alone."""
     
-    base = draw(st.sampled_from(base_currencies))
-    quote = draw(st.sampled_from(quote_currencies))
-    market = f"{base}-{quote}"
-    
-    # Generate trading signal parameters
-    action = draw(st.sampled_from(['buy', 'sell']))
-    confidence = draw(st.floats(min_value=0.0, max_value=1.0, allow_nan=False, allow_infinity=False))
-    price = draw(st.floats(min_value=1.0, max_value=100000.0, allow_nan=False, allow_infinity=False))
-    volume = draw(st.floats(min_value=0.001, max_value=1000.0, allow_nan=False, allow_infinity=False))
-    
-    # Generate strategy ID
-    strategy_id = draw(st.text(
-        alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'), whitelist_characters='_-'),
-        min_size=3, max_size=20
-    ))
-    assume(len(strategy_id.strip()) >= 3)
-    
-    # Use fixed timestamp to avoid flaky tests
-    timestamp = datetime(2025, 1, 1, 12, 0, 0)
+    __slots__ = ()
+
+
+# Shrinking (and the explain phase) is skipped unless HYPOTHESIS_SHRINK=1 is set
+# for local debugging, so a failing example doesn't balloon the run time.
+SHRINK = os.getenv("HYPOTHESIS_SHRINK") == "1"
+_PHASES = (
+    (Phase.explicit, Phase.reuse, Phase.generate, Phase.target, Phase.shrink, Phase.explain)
+    if SHRINK
+    else (Phase.explicit, Phase.reuse, Phase.generate, Phase.target)
+)
+
+
+_FIXED_TS = datetime(2025, 1, 1, 12, 0, 0)
+
+
+@functools.lru_cache(maxsize=256)
+def _signal(market, action, confidence, price, volume, strategy_id, timestamp=_FIXED_TS):
+    """TradingSignal per distinct field tuple (repeats during replay share one instance).
     
+    Tests must treat the returned signal as read-only.
+    """
     return TradingSignal(
         market=market,
         action=action,
@@ -53,52 +59,92 @@ def valid_trading_signals(draw):
     )
 
 
-@composite
-def invalid_trading_signals(draw):
-    """Generate invalid trading signals for negative testing."""
-    invalid_type = draw(st.sampled_from([
-        'empty_market',
-        'invalid_action',
-        'negative_confidence',
-        'confidence_over_one',
-        'negative_price',
-        'zero_price',
-        'negative_volume',
-        'zero_volume',
-        'empty_strategy_id'
-    ]))
-    
-    # Start with a valid signal and then break one field
-    base_signal = {
-        'market': 'KRW-BTC',
-        'action': 'buy',
-        'confidence': 0.5,
-        'price': 50000.0,
-        'volume': 0.1,
-        'strategy_id': 'test_strategy',
-        'timestamp': datetime(2025, 1, 1, 12, 0, 0)  # Fixed timestamp
-    }
-    
-    if invalid_type == 'empty_market':
-        base_signal['market'] = ''
-    elif invalid_type == 'invalid_action':
-        base_signal['action'] = 'invalid_action'
-    elif invalid_type == 'negative_confidence':
-        base_signal['confidence'] = -0.1
-    elif invalid_type == 'confidence_over_one':
-        base_signal['confidence'] = 1.1
-    elif invalid_type == 'negative_price':
-        base_signal['price'] = -100.0
-    elif invalid_type == 'zero_price':
-        base_signal['price'] = 0.0
-    elif invalid_type == 'negative_volume':
-        base_signal['volume'] = -0.1
-    elif invalid_type == 'zero_volume':
-        base_signal['volume'] = 0.0
-    elif invalid_type == 'empty_strategy_id':
-        base_signal['strategy_id'] = ''
-    
-    return TradingSignal(**base_signal)
+def _must_create(order_manager, signal):
+    """create_order that fails the test when no order comes back."""
+    order = order_manager.create_order(signal)
+    assert order is not None, f"No order created for {signal.market}/{signal.action} signal"
+    return order
+
+
+def _boundary_signal(action, confidence, price=50000.0, volume=0.1):
+    """Valid signal pinned to a boundary value, for @example cases."""
+    return _signal('KRW-BTC', action, confidence, price, volume, 'boundary')
+
+
+_MARKETS = tuple(f"KRW-{quote}" for quote in ('BTC', 'ETH', 'ADA', 'DOT', 'LINK', 'XRP', 'LTC'))
+
+# Valid trading signals for testing (fixed timestamp to avoid flaky tests)
+valid_trading_signals = st.builds(
+    _signal,
+    market=st.sampled_from(_MARKETS),
+    action=st.sampled_from(('buy', 'sell')),
+    confidence=st.floats(min_value=0.0, max_value=1.0, allow_nan=False, allow_infinity=False),
+    price=st.floats(min_value=1.0, max_value=100000.0, allow_nan=False, allow_infinity=False),
+    volume=st.floats(min_value=0.001, max_value=1000.0, allow_nan=False, allow_infinity=False),
+    strategy_id=st.text(alphabet=st.sampled_from(string.ascii_letters + string.digits), min_size=3, max_size=20),
+    timestamp=st.just(_FIXED_TS)
+)
+
+
+_BASE_SIGNAL_FIELDS = {
+    'market': 'KRW-BTC',
+    'action': 'buy',
+    'confidence': 0.5,
+    'price': 50000.0,
+    'volume': 0.1,
+    'strategy_id': 'test_strategy',
+    'timestamp': _FIXED_TS
+}
+
+
+def _signal_with(field, value):
+    """Strategy for the base signal with one field replaced."""
+    fields = {**_BASE_SIGNAL_FIELDS, field: value}
+    return st.builds(_signal, **{name: st.just(v) for name, v in fields.items()})
+
+
+_KRW_MARKETS = frozenset(_MARKETS)
+_ORDER_SIDES = frozenset(('bid', 'ask'))
+_ORDER_TYPES = frozenset(('limit', 'market'))
+
+
+def _assert_order_matches(order, signal):
+    """Field checks shared by every order created from a valid signal."""
+    assert order.market in _KRW_MARKETS, f"Order should be for a KRW market pair, got '{order.market}'"
+    assert order.side in _ORDER_SIDES, f"Order side '{order.side}' should be valid"
+    assert order.ord_type in _ORDER_TYPES, f"Order type '{order.ord_type}' should be valid"
+    assert order.volume > 0, "Order volume should be positive"
+    assert order.validate(), "Created order should pass validation"
+    assert signal.strategy_id in order.identifier, "Order identifier should contain strategy ID"
+
+
+_SIDES = frozenset(('buy', 'sell'))
+
+
+def _is_valid_signal(signal):
+    """Expected validity of a generated signal, mirroring TradingSignal.validate."""
+    return (
+        bool(signal.market)
+        and signal.action in _SIDES
+        and 0.0 <= signal.confidence <= 1.0
+        and signal.price > 0
+        and signal.volume > 0
+        and bool(signal.strategy_id)
+    )
+
+
+# Invalid trading signals for negative testing: a valid signal with one field broken
+invalid_trading_signals = st.one_of(
+    _signal_with('market', ''),
+    _signal_with('action', 'invalid_action'),
+    _signal_with('confidence', -0.1),
+    _signal_with('confidence', 1.1),
+    _signal_with('price', -100.0),
+    _signal_with('price', 0.0),
+    _signal_with('volume', -0.1),
+    _signal_with('volume', 0.0),
+    _signal_with('strategy_id', '')
+)
 
 
 @composite
@@ -118,33 +164,48 @@ def mock_account_positions(draw):
         unit_currency='KRW'
     ))
     
-    # Add some crypto positions for sell orders
-    crypto_currencies = ['BTC', 'ETH', 'ADA', 'DOT']
-    num_cryptos = draw(st.integers(min_value=1, max_value=3))
+    # Add some crypto positions for sell orders (locked as a fraction of balance keeps locked <= balance)
+    crypto_currencies = ('BTC', 'ETH', 'ADA', 'DOT')
+    crypto_rows = draw(st.lists(
+        st.tuples(
+            st.sampled_from(crypto_currencies),
+            st.floats(min_value=0.0, max_value=10.0, allow_nan=False, allow_infinity=False),
+            st.floats(min_value=0.0, max_value=1.0, allow_nan=False, allow_infinity=False),
+            st.floats(min_value=1000.0, max_value=100000.0, allow_nan=False, allow_infinity=False)
+        ),
+        min_size=1, max_size=3
+    ))
     
-    for _ in range(num_cryptos):
-        currency = draw(st.sampled_from(crypto_currencies))
-        balance = draw(st.floats(min_value=0.0, max_value=10.0, allow_nan=False, allow_infinity=False))
-        locked = draw(st.floats(min_value=0.0, max_value=balance, allow_nan=False, allow_infinity=False))
-        avg_buy_price = draw(st.floats(min_value=1000.0, max_value=100000.0, allow_nan=False, allow_infinity=False))
-        
-        positions.append(Position(
+    positions.extend(
+        Position(
             market=currency,
             avg_buy_price=avg_buy_price,
             balance=balance,
-            locked=locked,
+            locked=balance * locked_fraction,
             unit_currency='KRW'
-        ))
+        )
+        for currency, balance, locked_fraction, avg_buy_price in crypto_rows
+    )
     
     return positions
 
 
+@pytest.fixture(scope="class")
+def order_manager():
+    """OrderManager shared by the property tests (create_order keeps no per-call state)."""
+    return OrderManager(api_client=_StubAPIClient())
+
+
 class TestOrderCreationAccuracy:
     """Property-based tests for order creation accuracy."""
     
-    @given(signal=valid_trading_signals())
-    @settings(max_examples=100)
-    def test_property_11_order_creation_accuracy(self, signal):
+    @given(signal=valid_trading_signals)
+    @example(signal=_boundary_signal('buy', 0.8))
+    @example(signal=_boundary_signal('buy', 0.8000001))
+    @example(signal=_boundary_signal('sell', 0.0, price=1.0, volume=0.001))
+    @example(signal=_boundary_signal('sell', 1.0, price=100000.0, volume=1000.0))
+    @settings(max_examples=25, phases=_PHASES, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    def test_property_11_order_creation_accuracy(self, order_manager, signal):
         """
         **Feature: upbit-trading-bot, Property 11: Order Creation Accuracy**
         **Validates: Requirements 4.1**
@@ -152,59 +213,44 @@ class TestOrderCreationAccuracy:
         Property: For any valid trading signal, the created order should match 
         the signal's market, side, and volume specifications.
         """
-        # Create mock API client
-        mock_api_client = Mock(spec=UpbitAPIClient)
-        
-        # Create OrderManager
-        order_manager = OrderManager(api_client=mock_api_client)
-        
-        # Create order from signal
-        order = order_manager.create_order(signal)
-        
         # Property 1: Order should be created successfully for valid signals
-        assert order is not None, "Order should be created for valid trading signal"
+        order = _must_create(order_manager, signal)
+        
+        market, side, ord_type, price, volume = order.market, order.side, order.ord_type, order.price, order.volume
         
         # Property 2: Order market should match signal market
-        assert order.market == signal.market, f"Order market '{order.market}' should match signal market '{signal.market}'"
+        assert market == signal.market, f"Order market '{market}' should match signal market '{signal.market}'"
         
         # Property 3: Order side should correctly map from signal action
         expected_side = 'bid' if signal.action == 'buy' else 'ask'
-        assert order.side == expected_side, f"Order side '{order.side}' should match expected side '{expected_side}' for action '{signal.action}'"
+        assert side == expected_side, f"Order side '{side}' should match expected side '{expected_side}' for action '{signal.action}'"
         
         # Property 4: Order volume should match signal volume
-        assert order.volume == signal.volume, f"Order volume '{order.volume}' should match signal volume '{signal.volume}'"
+        assert volume == signal.volume, f"Order volume '{volume}' should match signal volume '{signal.volume}'"
         
         # Property 5: Order type should be determined by confidence level
-        if signal.confidence > 0.8:
-            assert order.ord_type == 'market', f"High confidence signal (confidence={signal.confidence}) should create market order"
-            assert order.price is None, "Market orders should not have a price"
-        else:
-            assert order.ord_type == 'limit', f"Low confidence signal (confidence={signal.confidence}) should create limit order"
-            assert order.price == signal.price, f"Limit order price '{order.price}' should match signal price '{signal.price}'"
+        # (market orders carry no price, limit orders carry the signal price)
+        is_market = signal.confidence > 0.8
+        expected_type, expected_price = ('market', None) if is_market else ('limit', signal.price)
+        assert (ord_type, price) == (expected_type, expected_price), (
+            f"Signal with confidence={signal.confidence} should create a {expected_type} order "
+            f"with price {expected_price}, got {ord_type} order with price {price}"
+        )
         
         # Property 6: Order should have valid identifier
         assert order.identifier is not None, "Order should have an identifier"
         assert isinstance(order.identifier, str), "Order identifier should be a string"
-        assert signal.strategy_id in order.identifier, "Order identifier should contain strategy ID"
-        
-        # Property 7: Created order should be valid
-        assert order.validate(), "Created order should pass validation"
         
-        # Property 8: Order should preserve all required fields from signal
-        assert order.market.startswith('KRW-'), "Order should be for KRW market pairs"
-        assert order.side in ['bid', 'ask'], "Order side should be valid"
-        assert order.ord_type in ['limit', 'market'], "Order type should be valid"
-        assert order.volume > 0, "Order volume should be positive"
+        # Properties 7-8: order validates and keeps well-formed market/side/type/volume
+        # fields (also re-checks Property 6's strategy ID in the identifier)
+        _assert_order_matches(order, signal)
     
-    @given(signal=invalid_trading_signals())
-    @settings(max_examples=50)
-    def test_invalid_signal_handling(self, signal):
+    @given(signal=invalid_trading_signals)
+    @settings(max_examples=50, phases=_PHASES, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    def test_invalid_signal_handling(self, order_manager, signal):
         """Test that invalid trading signals are properly rejected."""
-        # Create mock API client
-        mock_api_client = Mock(spec=UpbitAPIClient)
-        
-        # Create OrderManager
-        order_manager = OrderManager(api_client=mock_api_client)
+        # The strategy itself must only produce invalid signals
+        assert not _is_valid_signal(signal), f"Strategy produced a valid signal: {signal}"
         
         # Attempt to create order from invalid signal
         order = order_manager.create_order(signal)
@@ -212,16 +258,10 @@ class TestOrderCreationAccuracy:
         # Property: Invalid signals should not create orders
         assert order is None, "Invalid trading signals should not create orders"
     
-    @given(signal=valid_trading_signals())
-    @settings(max_examples=30)
-    def test_order_creation_consistency(self, signal):
+    @given(signal=valid_trading_signals)
+    @settings(max_examples=30, phases=_PHASES, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    def test_order_creation_consistency(self, order_manager, signal):
         """Test that order creation is consistent for the same signal."""
-        # Create mock API client
-        mock_api_client = Mock(spec=UpbitAPIClient)
-        
-        # Create OrderManager
-        order_manager = OrderManager(api_client=mock_api_client)
-        
         # Create multiple orders from the same signal
         order1 = order_manager.create_order(signal)
         order2 = order_manager.create_order(signal)
@@ -244,127 +284,49 @@ class TestOrderCreationAccuracy:
         # Note: This is expected behavior since identifiers are based on strategy_id + timestamp
         assert order1.identifier == order2.identifier, "Order identifiers should be consistent for same signal"
     
-    def test_buy_signal_creates_bid_order(self):
-        """Test that buy signals create bid orders."""
-        # Create mock API client
-        mock_api_client = Mock(spec=UpbitAPIClient)
-        
-        # Create OrderManager
-        order_manager = OrderManager(api_client=mock_api_client)
-        
-        # Create buy signal
-        buy_signal = TradingSignal(
-            market='KRW-BTC',
-            action='buy',
-            confidence=0.5,
-            price=50000.0,
-            volume=0.1,
-            strategy_id='test_strategy',
-            timestamp=datetime.now()
-        )
-        
-        # Create order
-        order = order_manager.create_order(buy_signal)
-        
-        # Property: Buy signal should create bid order
-        assert order is not None, "Buy signal should create an order"
-        assert order.side == 'bid', "Buy signal should create bid order"
-    
-    def test_sell_signal_creates_ask_order(self):
-        """Test that sell signals create ask orders."""
-        # Create mock API client
-        mock_api_client = Mock(spec=UpbitAPIClient)
-        
-        # Create OrderManager
-        order_manager = OrderManager(api_client=mock_api_client)
-        
-        # Create sell signal
-        sell_signal = TradingSignal(
-            market='KRW-BTC',
-            action='sell',
-            confidence=0.5,
-            price=50000.0,
-            volume=0.1,
-            strategy_id='test_strategy',
-            timestamp=datetime.now()
-        )
-        
-        # Create order
-        order = order_manager.create_order(sell_signal)
-        
-        # Property: Sell signal should create ask order
-        assert order is not None, "Sell signal should create an order"
-        assert order.side == 'ask', "Sell signal should create ask order"
-    
-    def test_high_confidence_creates_market_order(self):
-        """Test that high confidence signals create market orders."""
-        # Create mock API client
-        mock_api_client = Mock(spec=UpbitAPIClient)
-        
-        # Create OrderManager
-        order_manager = OrderManager(api_client=mock_api_client)
-        
-        # Create high confidence signal
-        high_confidence_signal = TradingSignal(
-            market='KRW-BTC',
-            action='buy',
-            confidence=0.9,  # High confidence
-            price=50000.0,
-            volume=0.1,
-            strategy_id='test_strategy',
-            timestamp=datetime.now()
-        )
-        
-        # Create order
-        order = order_manager.create_order(high_confidence_signal)
-        
-        # Property: High confidence should create market order
-        assert order is not None, "High confidence signal should create an order"
-        assert order.ord_type == 'market', "High confidence signal should create market order"
-        assert order.price is None, "Market order should not have price"
-    
-    def test_low_confidence_creates_limit_order(self):
-        """Test that low confidence signals create limit orders."""
-        # Create mock API client
-        mock_api_client = Mock(spec=UpbitAPIClient)
-        
-        # Create OrderManager
-        order_manager = OrderManager(api_client=mock_api_client)
-        
-        # Create low confidence signal
-        low_confidence_signal = TradingSignal(
-            market='KRW-BTC',
-            action='buy',
-            confidence=0.3,  # Low confidence
-            price=50000.0,
-            volume=0.1,
-            strategy_id='test_strategy',
-            timestamp=datetime.now()
+    @pytest.mark.parametrize(
+        "market,action,confidence,expected_side,expected_type,expected_price",
+        [
+            ('KRW-BTC', 'buy', 0.5, 'bid', 'limit', 50000.0),
+            ('KRW-BTC', 'sell', 0.5, 'ask', 'limit', 50000.0),
+            ('KRW-BTC', 'buy', 0.9, 'bid', 'market', None),
+            ('KRW-BTC', 'buy', 0.3, 'bid', 'limit', 50000.0),
+            ('', 'buy', 0.5, None, None, None),
+        ],
+        ids=[
+            'buy_creates_bid',
+            'sell_creates_ask',
+            'high_confidence_creates_market',
+            'low_confidence_creates_limit',
+            'invalid_signal_returns_none',
+        ]
+    )
+    def test_signal_to_order_mapping(self, order_manager, market, action, confidence,
+                                     expected_side, expected_type, expected_price):
+        """Test side/type/price mapping for fixed signals, and graceful rejection of invalid ones."""
+        signal = _signal(market, action, confidence, 50000.0, 0.1, 'test_strategy')
+        
+        if expected_side is None:
+            # Property: Invalid signal should return None instead of raising exception
+            order = order_manager.create_order(signal)
+            assert order is None, "Invalid signal should return None instead of raising exception"
+            return
+        
+        # Property: Action maps to side, confidence decides type and price
+        order = _must_create(order_manager, signal)
+        assert (order.side, order.ord_type, order.price) == (expected_side, expected_type, expected_price), (
+            f"{action} signal (confidence={confidence}) should create {expected_side}/{expected_type} order "
+            f"with price {expected_price}, got {order.side}/{order.ord_type} with price {order.price}"
         )
-        
-        # Create order
-        order = order_manager.create_order(low_confidence_signal)
-        
-        # Property: Low confidence should create limit order
-        assert order is not None, "Low confidence signal should create an order"
-        assert order.ord_type == 'limit', "Low confidence signal should create limit order"
-        assert order.price == low_confidence_signal.price, "Limit order should have signal price"
     
-    @given(signal=valid_trading_signals())
-    @settings(max_examples=20)
-    def test_order_identifier_format(self, signal):
+    @given(signal=valid_trading_signals)
+    @settings(max_examples=20, phases=_PHASES, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+    def test_order_identifier_format(self, order_manager, signal):
         """Test that order identifiers follow expected format."""
-        # Create mock API client
-        mock_api_client = Mock(spec=UpbitAPIClient)
-        
-        # Create OrderManager
-        order_manager = OrderManager(api_client=mock_api_client)
-        
         # Create order
-        order = order_manager.create_order(signal)
+        order = _must_create(order_manager, signal)
         
         # Property: Order should have identifier
-        assert order is not None, "Order should be created"
         assert order.identifier is not None, "Order should have identifier"
         
         # Property: Identifier should contain strategy ID
@@ -380,58 +342,3 @@ class TestOrderCreationAccuracy:
             assert timestamp_part > 0, "Timestamp part should be positive"
         except ValueError:
             pytest.fail("Last part of identifier should be numeric timestamp")
-    
-    def test_order_creation_exception_handling(self):
-        """Test order creation behavior when exceptions occur."""
-        # Create mock API client
-        mock_api_client = Mock(spec=UpbitAPIClient)
-        
-        # Create OrderManager
-        order_manager = OrderManager(api_client=mock_api_client)
-        
-        # Create signal that will cause validation to fail
-        invalid_signal = TradingSignal(
-            market='',  # Invalid empty market
-            action='buy',
-            confidence=0.5,
-            price=50000.0,
-            volume=0.1,
-            strategy_id='test_strategy',
-            timestamp=datetime.now()
-        )
-        
-        # Attempt to create order
-        order = order_manager.create_order(invalid_signal)
-        
-        # Property: Exception should be handled gracefully
-        assert order is None, "Invalid signal should return None instead of raising exception"
-    
-    @given(signal=valid_trading_signals())
-    @settings(max_examples=20)
-    def test_order_validation_after_creation(self, signal):
-        """Test that created orders pass validation."""
-        # Create mock API client
-        mock_api_client = Mock(spec=UpbitAPIClient)
-        
-        # Create OrderManager
-        order_manager = OrderManager(api_client=mock_api_client)
-        
-        # Create order
-        order = order_manager.create_order(signal)
-        
-        # Property: Created order should be valid
-        assert order is not None, "Order should be created"
-        assert order.validate(), "Created order should pass validation"
-        
-        # Property: All required fields should be present and valid
-        assert order.market, "Order should have market"
-        assert order.side in ['bid', 'ask'], "Order should have valid side"
-        assert order.ord_type in ['limit', 'market'], "Order should have valid type"
-        assert order.volume > 0, "Order should have positive volume"
-        
-        # Property: Conditional fields should be valid
-        if order.ord_type == 'limit':
-            assert order.price is not None, "Limit order should have price"
-            assert order.price > 0, "Limit order price should be positive"
-        else:
-            assert order.price is None, "Market order should not have price"
\ No newline at end of file
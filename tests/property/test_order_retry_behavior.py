@@ -4,11 +4,14 @@
 **Validates: Requirements 4.3**
 """
 
+import dataclasses
+import functools
+import itertools
 import pytest
-import time
+import string
 from datetime import datetime
-from unittest.mock import Mock, patch, call
-from hypothesis import given, strategies as st, assume, settings
+from unittest.mock import Mock, patch
+from hypothesis import given, strategies as st, settings
 from hypothesis.strategies import composite
 
 from upbit_trading_bot.order.manager import OrderManager
@@ -16,6 +19,45 @@ from upbit_trading_bot.data.models import Order, OrderResult, Position
 from upbit_trading_bot.api.client import UpbitAPIClient, UpbitAPIError
 
 
+_TEMPLATE_RESULT = OrderResult(
+    order_id="",
+    market="KRW-BTC",
+    side="bid",
+    ord_type="limit",
+    price=None,
+    volume=0.0,
+    remaining_volume=0.0,
+    reserved_fee=0.0,
+    remaining_fee=0.0,
+    paid_fee=0.0,
+    locked=0.0,
+    executed_volume=0.0,
+    trades_count=0
+)
+_order_ids = itertools.count(1)
+
+_ID_ALPHA = string.ascii_letters + string.digits + '_-'
+
+
+def make_result(order, order_id=None):
+    """Build an unfilled OrderResult for the given order from the shared template."""
+    return dataclasses.replace(
+        _TEMPLATE_RESULT,
+        order_id=order_id or f"order_{next(_order_ids)}",
+        market=order.market,
+        side=order.side,
+        ord_type=order.ord_type,
+        price=order.price,
+        volume=order.volume,
+        remaining_volume=order.volume
+    )
+
+
+def _max_examples(n):
+    """Per-test example count, capped by the active profile (e.g. HYPOTHESIS_PROFILE=ci)."""
+    return min(n, settings.default.max_examples)
+
+
 @composite
 def valid_orders(draw):
     """Generate valid orders for testing."""
@@ -40,11 +82,7 @@ def valid_orders(draw):
     volume = draw(st.floats(min_value=0.001, max_value=1000.0, allow_nan=False, allow_infinity=False))
     
     # Generate identifier
-    identifier = draw(st.text(
-        alphabet=st.characters(whitelist_categories=('Lu', 'Ll', 'Nd'), whitelist_characters='_-'),
-        min_size=5, max_size=30
-    ))
-    assume(len(identifier.strip()) >= 5)
+    identifier = draw(st.text(alphabet=_ID_ALPHA, min_size=5, max_size=30))
     
     return Order(
         market=market,
@@ -56,62 +94,38 @@ def valid_orders(draw):
     )
 
 
-@composite
-def mock_positions_with_sufficient_balance(draw, order):
-    """Generate mock positions with sufficient balance for the given order."""
-    positions = []
-    
-    if order.side == 'bid':  # 매수 주문 - KRW 잔고 필요
-        # 필요한 금액 계산
-        if order.ord_type == 'market':
-            required_balance = order.volume  # 시장가 매수는 volume이 KRW 금액
-        else:
-            required_balance = order.price * order.volume  # 지정가 매수
-        
-        # 충분한 KRW 잔고 생성 (필요 금액의 2~5배)
-        multiplier = draw(st.floats(min_value=2.0, max_value=5.0))
-        krw_balance = required_balance * multiplier
-        krw_locked = draw(st.floats(min_value=0.0, max_value=krw_balance * 0.1))
-        
-        positions.append(Position(
-            market='KRW',
-            avg_buy_price=1.0,
-            balance=krw_balance,
-            locked=krw_locked,
-            unit_currency='KRW'
-        ))
-        
-    else:  # 매도 주문 - 해당 코인 잔고 필요
-        market_currency = order.market.split('-')[1]  # KRW-BTC -> BTC
-        
-        # 충분한 코인 잔고 생성 (필요 수량의 2~5배)
-        multiplier = draw(st.floats(min_value=2.0, max_value=5.0))
-        coin_balance = order.volume * multiplier
-        coin_locked = draw(st.floats(min_value=0.0, max_value=coin_balance * 0.1))
-        
-        avg_buy_price = draw(st.floats(min_value=1000.0, max_value=100000.0))
-        
-        positions.append(Position(
+# OrderManager only checks balance - locked >= required, so one static
+# "always sufficient" account snapshot covers every generated order
+_KRW_POSITION = Position(
+    market='KRW',
+    avg_buy_price=1.0,
+    balance=1e18,
+    locked=0.0,
+    unit_currency='KRW'
+)
+_BID_POSITIONS = [_KRW_POSITION]
+
+
+@functools.lru_cache(maxsize=None)
+def _ask_positions(market_currency):
+    """Always-sufficient coin + KRW positions for sell orders, memoized per coin."""
+    return [
+        Position(
             market=market_currency,
-            avg_buy_price=avg_buy_price,
-            balance=coin_balance,
-            locked=coin_locked,
-            unit_currency='KRW'
-        ))
-        
-        # KRW 포지션도 추가 (항상 존재해야 함)
-        krw_balance = draw(st.floats(min_value=100000.0, max_value=1000000.0))
-        krw_locked = draw(st.floats(min_value=0.0, max_value=krw_balance * 0.1))
-        
-        positions.append(Position(
-            market='KRW',
-            avg_buy_price=1.0,
-            balance=krw_balance,
-            locked=krw_locked,
+            avg_buy_price=50000.0,
+            balance=1e18,
+            locked=0.0,
             unit_currency='KRW'
-        ))
-    
-    return positions
+        ),
+        _KRW_POSITION
+    ]
+
+
+def sufficient_positions(order):
+    """Positions with enough balance for the given order."""
+    if order.side == 'bid':  # 매수 주문 - KRW 잔고 필요
+        return _BID_POSITIONS
+    return _ask_positions(order.market.split('-')[1])  # KRW-BTC -> BTC
 
 
 @composite
@@ -131,12 +145,68 @@ def api_error_types(draw):
     return UpbitAPIError(error_message)
 
 
+# 고정 주문 시나리오 (KRW 잔고 100,000)
+_FIXED_ORDER = Order(
+    market='KRW-BTC',
+    side='bid',
+    ord_type='limit',
+    price=50000.0,
+    volume=0.1,
+    identifier='test_order'
+)
+_LARGE_ORDER = dataclasses.replace(_FIXED_ORDER, volume=100.0)  # Requires 5,000,000 KRW
+_FIXED_POSITIONS = [dataclasses.replace(_KRW_POSITION, balance=100000.0)]
+_FIXED_RESULT = make_result(_FIXED_ORDER, order_id="successful_order_123")
+
+# (kind, order, place_order side_effect, expected place_order calls, expected delays, succeeds)
+_SCENARIOS = [
+    pytest.param('validation_failure', _LARGE_ORDER, None, 0, [], False,
+                 id='validation_failure_no_retry'),
+    pytest.param('non_api_error', _FIXED_ORDER, ValueError("Invalid order data"), 1, [], False,
+                 id='non_api_error_no_retry'),
+    pytest.param('exponential_backoff', _FIXED_ORDER, UpbitAPIError("API error"), 4, [1.0, 2.0, 4.0], False,
+                 id='exponential_backoff_pattern'),
+    pytest.param('database_operations', _FIXED_ORDER,
+                 [UpbitAPIError("First failure"), UpbitAPIError("Second failure"), _FIXED_RESULT],
+                 3, [1.0, 2.0], True,
+                 id='database_operations'),
+    pytest.param('active_orders_management', _FIXED_ORDER, UpbitAPIError("Always fails"), 4, [1.0, 2.0, 4.0], False,
+                 id='active_orders_management'),
+]
+
+
+@pytest.fixture(scope="class")
+def retry_env():
+    """(mock_api_client, order_manager) pair shared across Hypothesis examples."""
+    mock_api_client = Mock(spec=UpbitAPIClient)
+    return mock_api_client, OrderManager(api_client=mock_api_client, max_retries=3)
+
+
+@pytest.fixture(scope="class", autouse=True)
+def sleep_calls():
+    """Record the retry delays instead of sleeping; cleared per example via _reset()."""
+    calls = []
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('upbit_trading_bot.order.manager.time.sleep', calls.append)
+        yield calls
+
+
+def _reset(retry_env, sleep_calls, max_retries=3):
+    """Clear the shared mock, manager state and recorded delays from the previous example."""
+    mock_api_client, order_manager = retry_env
+    mock_api_client.reset_mock(return_value=True, side_effect=True)
+    order_manager.active_orders.clear()
+    order_manager.max_retries = max_retries
+    sleep_calls.clear()
+    return mock_api_client, order_manager
+
+
 class TestOrderRetryBehavior:
     """Property-based tests for order retry behavior."""
     
     @given(data=st.data())
-    @settings(max_examples=50)
-    def test_property_13_order_retry_behavior_success_after_retries(self, data):
+    @settings(max_examples=_max_examples(50))
+    def test_property_13_order_retry_behavior_success_after_retries(self, retry_env, sleep_calls, data):
         """
         **Feature: upbit-trading-bot, Property 13: Order Retry Behavior**
         **Validates: Requirements 4.3**
@@ -147,45 +217,26 @@ class TestOrderRetryBehavior:
         # Generate a valid order
         order = data.draw(valid_orders())
         
-        # Generate positions with sufficient balance
-        positions = data.draw(mock_positions_with_sufficient_balance(order))
+        # Positions with sufficient balance
+        positions = sufficient_positions(order)
         
         # Generate the number of failures before success (0-3)
         failures_before_success = data.draw(st.integers(min_value=0, max_value=3))
         
-        # Create mock API client
-        mock_api_client = Mock(spec=UpbitAPIClient)
+        # Reset the shared mock API client
+        mock_api_client, order_manager = _reset(retry_env, sleep_calls)
         mock_api_client.get_accounts.return_value = positions
         
         # Create expected successful result
-        expected_result = OrderResult(
-            order_id=f"order_{int(time.time())}",
-            market=order.market,
-            side=order.side,
-            ord_type=order.ord_type,
-            price=order.price,
-            volume=order.volume,
-            remaining_volume=order.volume,
-            reserved_fee=0.0,
-            remaining_fee=0.0,
-            paid_fee=0.0,
-            locked=0.0,
-            executed_volume=0.0,
-            trades_count=0
-        )
+        expected_result = make_result(order)
         
         # Setup place_order to fail N times then succeed
         api_error = data.draw(api_error_types())
         side_effects = [api_error] * failures_before_success + [expected_result]
         mock_api_client.place_order.side_effect = side_effects
         
-        # Create OrderManager with default retry settings
-        order_manager = OrderManager(api_client=mock_api_client, max_retries=3)
-        
-        # Mock time.sleep to avoid actual delays in tests
-        with patch('time.sleep') as mock_sleep:
-            # Execute order
-            result = order_manager.execute_order(order)
+        # Execute order
+        result = order_manager.execute_order(order)
         
         # Property 1: Order should succeed if it succeeds within retry limit
         if failures_before_success <= 3:
@@ -198,12 +249,12 @@ class TestOrderRetryBehavior:
             
             # Property 3: Sleep should be called for each retry (not for first attempt or final success)
             expected_sleep_calls = failures_before_success
-            assert mock_sleep.call_count == expected_sleep_calls, f"sleep should be called {expected_sleep_calls} times"
+            assert len(sleep_calls) == expected_sleep_calls, f"sleep should be called {expected_sleep_calls} times"
             
             # Property 4: Sleep delays should follow exponential backoff pattern
             if expected_sleep_calls > 0:
                 expected_delays = [1.0, 2.0, 4.0][:expected_sleep_calls]
-                actual_delays = [call.args[0] for call in mock_sleep.call_args_list]
+                actual_delays = sleep_calls
                 assert actual_delays == expected_delays, f"Sleep delays should follow exponential backoff: expected {expected_delays}, got {actual_delays}"
         
         else:
@@ -211,8 +262,8 @@ class TestOrderRetryBehavior:
             assert result is None, "Order should fail if failures exceed retry limit"
     
     @given(data=st.data())
-    @settings(max_examples=30)
-    def test_property_13_order_retry_behavior_max_retries_exceeded(self, data):
+    @settings(max_examples=_max_examples(30))
+    def test_property_13_order_retry_behavior_max_retries_exceeded(self, retry_env, sleep_calls, data):
         """
         **Feature: upbit-trading-bot, Property 13: Order Retry Behavior**
         **Validates: Requirements 4.3**
@@ -223,24 +274,19 @@ class TestOrderRetryBehavior:
         # Generate a valid order
         order = data.draw(valid_orders())
         
-        # Generate positions with sufficient balance
-        positions = data.draw(mock_positions_with_sufficient_balance(order))
+        # Positions with sufficient balance
+        positions = sufficient_positions(order)
         
-        # Create mock API client that always fails
-        mock_api_client = Mock(spec=UpbitAPIClient)
+        # Reset the shared mock API client so that it always fails
+        mock_api_client, order_manager = _reset(retry_env, sleep_calls)
         mock_api_client.get_accounts.return_value = positions
         
         # Generate API error
         api_error = data.draw(api_error_types())
         mock_api_client.place_order.side_effect = api_error
         
-        # Create OrderManager with default retry settings
-        order_manager = OrderManager(api_client=mock_api_client, max_retries=3)
-        
-        # Mock time.sleep to avoid actual delays in tests
-        with patch('time.sleep') as mock_sleep:
-            # Execute order
-            result = order_manager.execute_order(order)
+        # Execute order
+        result = order_manager.execute_order(order)
         
         # Property 1: Order should fail when all retries are exhausted
         assert result is None, "Order should fail when all retries are exhausted"
@@ -249,11 +295,11 @@ class TestOrderRetryBehavior:
         assert mock_api_client.place_order.call_count == 4, "place_order should be called 4 times (1 initial + 3 retries)"
         
         # Property 3: Sleep should be called exactly 3 times (for each retry)
-        assert mock_sleep.call_count == 3, "sleep should be called 3 times for retries"
+        assert len(sleep_calls) == 3, "sleep should be called 3 times for retries"
         
         # Property 4: Sleep delays should follow exponential backoff pattern
         expected_delays = [1.0, 2.0, 4.0]
-        actual_delays = [call.args[0] for call in mock_sleep.call_args_list]
+        actual_delays = sleep_calls
         assert actual_delays == expected_delays, f"Sleep delays should follow exponential backoff: expected {expected_delays}, got {actual_delays}"
         
         # Property 5: All place_order calls should use the same order
@@ -262,66 +308,21 @@ class TestOrderRetryBehavior:
             assert called_order == order, "All retry attempts should use the same order"
     
     @given(order=valid_orders())
-    @settings(max_examples=20)
-    def test_order_retry_behavior_first_attempt_success(self, order):
+    @settings(max_examples=_max_examples(20))
+    def test_order_retry_behavior_first_attempt_success(self, retry_env, sleep_calls, order):
         """Test retry behavior when first attempt succeeds."""
-        # Create sufficient balance positions
-        if order.side == 'bid':
-            required_balance = order.volume if order.ord_type == 'market' else order.price * order.volume
-            positions = [Position(
-                market='KRW',
-                avg_buy_price=1.0,
-                balance=required_balance * 3.0,
-                locked=0.0,
-                unit_currency='KRW'
-            )]
-        else:
-            market_currency = order.market.split('-')[1]
-            positions = [
-                Position(
-                    market=market_currency,
-                    avg_buy_price=50000.0,
-                    balance=order.volume * 3.0,
-                    locked=0.0,
-                    unit_currency='KRW'
-                ),
-                Position(
-                    market='KRW',
-                    avg_buy_price=1.0,
-                    balance=1000000.0,
-                    locked=0.0,
-                    unit_currency='KRW'
-                )
-            ]
-        
-        # Create mock API client that succeeds immediately
-        mock_api_client = Mock(spec=UpbitAPIClient)
+        # Positions with sufficient balance
+        positions = sufficient_positions(order)
+        
+        # Reset the shared mock API client so that it succeeds immediately
+        mock_api_client, order_manager = _reset(retry_env, sleep_calls)
         mock_api_client.get_accounts.return_value = positions
         
-        expected_result = OrderResult(
-            order_id=f"order_{int(time.time())}",
-            market=order.market,
-            side=order.side,
-            ord_type=order.ord_type,
-            price=order.price,
-            volume=order.volume,
-            remaining_volume=order.volume,
-            reserved_fee=0.0,
-            remaining_fee=0.0,
-            paid_fee=0.0,
-            locked=0.0,
-            executed_volume=0.0,
-            trades_count=0
-        )
+        expected_result = make_result(order)
         mock_api_client.place_order.return_value = expected_result
         
-        # Create OrderManager
-        order_manager = OrderManager(api_client=mock_api_client, max_retries=3)
-        
-        # Mock time.sleep
-        with patch('time.sleep') as mock_sleep:
-            # Execute order
-            result = order_manager.execute_order(order)
+        # Execute order
+        result = order_manager.execute_order(order)
         
         # Property: Should succeed immediately without retries
         assert result is not None, "Order should succeed on first attempt"
@@ -331,126 +332,22 @@ class TestOrderRetryBehavior:
         assert mock_api_client.place_order.call_count == 1, "place_order should be called exactly once"
         
         # Property: No sleep calls should be made
-        assert mock_sleep.call_count == 0, "No sleep calls should be made for immediate success"
-    
-    def test_order_retry_behavior_validation_failure_no_retry(self):
-        """Test that validation failures don't trigger retries."""
-        # Create order that will fail validation (insufficient balance)
-        order = Order(
-            market='KRW-BTC',
-            side='bid',
-            ord_type='limit',
-            price=50000.0,
-            volume=100.0,  # Requires 5,000,000 KRW
-            identifier='test_order'
-        )
-        
-        # Create insufficient balance
-        positions = [Position(
-            market='KRW',
-            avg_buy_price=1.0,
-            balance=1000.0,  # Only 1,000 KRW available
-            locked=0.0,
-            unit_currency='KRW'
-        )]
-        
-        # Create mock API client
-        mock_api_client = Mock(spec=UpbitAPIClient)
-        mock_api_client.get_accounts.return_value = positions
-        
-        # Create OrderManager
-        order_manager = OrderManager(api_client=mock_api_client, max_retries=3)
-        
-        # Mock time.sleep
-        with patch('time.sleep') as mock_sleep:
-            # Execute order
-            result = order_manager.execute_order(order)
-        
-        # Property: Should fail immediately without retries for validation failures
-        assert result is None, "Order should fail immediately for validation failures"
-        
-        # Property: place_order should not be called at all
-        assert mock_api_client.place_order.call_count == 0, "place_order should not be called for validation failures"
-        
-        # Property: No sleep calls should be made
-        assert mock_sleep.call_count == 0, "No sleep calls should be made for validation failures"
-    
-    def test_order_retry_behavior_non_api_error_no_retry(self):
-        """Test that non-API errors don't trigger retries."""
-        # Create valid order with sufficient balance
-        order = Order(
-            market='KRW-BTC',
-            side='bid',
-            ord_type='limit',
-            price=50000.0,
-            volume=0.1,
-            identifier='test_order'
-        )
-        
-        positions = [Position(
-            market='KRW',
-            avg_buy_price=1.0,
-            balance=100000.0,
-            locked=0.0,
-            unit_currency='KRW'
-        )]
-        
-        # Create mock API client that raises non-API exception
-        mock_api_client = Mock(spec=UpbitAPIClient)
-        mock_api_client.get_accounts.return_value = positions
-        mock_api_client.place_order.side_effect = ValueError("Invalid order data")  # Non-API error
-        
-        # Create OrderManager
-        order_manager = OrderManager(api_client=mock_api_client, max_retries=3)
-        
-        # Mock time.sleep
-        with patch('time.sleep') as mock_sleep:
-            # Execute order
-            result = order_manager.execute_order(order)
-        
-        # Property: Should fail immediately without retries for non-API errors
-        assert result is None, "Order should fail immediately for non-API errors"
-        
-        # Property: place_order should be called exactly once
-        assert mock_api_client.place_order.call_count == 1, "place_order should be called exactly once"
-        
-        # Property: No sleep calls should be made
-        assert mock_sleep.call_count == 0, "No sleep calls should be made for non-API errors"
+        assert len(sleep_calls) == 0, "No sleep calls should be made for immediate success"
     
     @given(max_retries=st.integers(min_value=0, max_value=10))
-    @settings(max_examples=20)
-    def test_order_retry_behavior_configurable_max_retries(self, max_retries):
+    @settings(max_examples=_max_examples(20))
+    def test_order_retry_behavior_configurable_max_retries(self, retry_env, sleep_calls, max_retries):
         """Test that max_retries parameter is respected."""
-        # Create valid order
-        order = Order(
-            market='KRW-BTC',
-            side='bid',
-            ord_type='limit',
-            price=50000.0,
-            volume=0.1,
-            identifier='test_order'
-        )
-        
-        positions = [Position(
-            market='KRW',
-            avg_buy_price=1.0,
-            balance=100000.0,
-            locked=0.0,
-            unit_currency='KRW'
-        )]
+        order = _FIXED_ORDER
+        positions = _FIXED_POSITIONS
         
-        # Create mock API client that always fails
-        mock_api_client = Mock(spec=UpbitAPIClient)
+        # Reset the shared mock API client and apply the custom max_retries
+        mock_api_client, order_manager = _reset(retry_env, sleep_calls, max_retries=max_retries)
         mock_api_client.get_accounts.return_value = positions
         mock_api_client.place_order.side_effect = UpbitAPIError("API error")
         
-        # Create OrderManager with custom max_retries
-        order_manager = OrderManager(api_client=mock_api_client, max_retries=max_retries)
-        
-        # Mock time.sleep
-        with patch('time.sleep') as mock_sleep:
-            # Execute order
-            result = order_manager.execute_order(order)
+        # Execute order
+        result = order_manager.execute_order(order)
         
         # Property: Should fail after exhausting retries
         assert result is None, "Order should fail after exhausting retries"
@@ -460,7 +357,7 @@ class TestOrderRetryBehavior:
         assert mock_api_client.place_order.call_count == expected_calls, f"place_order should be called {expected_calls} times"
         
         # Property: Sleep should be called exactly max_retries times
-        assert mock_sleep.call_count == max_retries, f"sleep should be called {max_retries} times"
+        assert len(sleep_calls) == max_retries, f"sleep should be called {max_retries} times"
         
         # Property: Sleep delays should follow exponential backoff pattern (up to available delays)
         if max_retries > 0:
@@ -473,186 +370,55 @@ class TestOrderRetryBehavior:
                 else:
                     actual_expected_delays.append(expected_delays[-1])  # Repeat last delay
             
-            actual_delays = [call.args[0] for call in mock_sleep.call_args_list]
+            actual_delays = sleep_calls
             assert actual_delays == actual_expected_delays, f"Sleep delays should follow pattern: expected {actual_expected_delays}, got {actual_delays}"
     
-    def test_order_retry_behavior_exponential_backoff_pattern(self):
-        """Test that exponential backoff delays follow the expected pattern."""
-        # Create valid order
-        order = Order(
-            market='KRW-BTC',
-            side='bid',
-            ord_type='limit',
-            price=50000.0,
-            volume=0.1,
-            identifier='test_order'
-        )
-        
-        positions = [Position(
-            market='KRW',
-            avg_buy_price=1.0,
-            balance=100000.0,
-            locked=0.0,
-            unit_currency='KRW'
-        )]
-        
-        # Create mock API client that always fails
-        mock_api_client = Mock(spec=UpbitAPIClient)
-        mock_api_client.get_accounts.return_value = positions
-        mock_api_client.place_order.side_effect = UpbitAPIError("API error")
-        
-        # Create OrderManager
-        order_manager = OrderManager(api_client=mock_api_client, max_retries=3)
+    @pytest.mark.parametrize(
+        "kind, order, side_effect, expected_place_calls, expected_delays, succeeds", _SCENARIOS
+    )
+    def test_order_retry_behavior_scenarios(self, retry_env, sleep_calls, kind, order, side_effect,
+                                            expected_place_calls, expected_delays, succeeds):
+        """Test validation/non-API failures, backoff delays, DB saves and active orders on fixed orders."""
+        mock_api_client, order_manager = _reset(retry_env, sleep_calls)
+        mock_api_client.get_accounts.return_value = _FIXED_POSITIONS
+        mock_api_client.place_order.side_effect = side_effect
         
         # Verify the retry_delays configuration
         assert order_manager.retry_delays == [1.0, 2.0, 4.0], "Retry delays should be configured as [1.0, 2.0, 4.0]"
         
-        # Mock time.sleep to capture delays
-        with patch('time.sleep') as mock_sleep:
-            # Execute order
-            result = order_manager.execute_order(order)
-        
-        # Property: Delays should follow exponential backoff pattern
-        expected_delays = [1.0, 2.0, 4.0]
-        actual_delays = [call.args[0] for call in mock_sleep.call_args_list]
-        assert actual_delays == expected_delays, f"Sleep delays should be {expected_delays}, got {actual_delays}"
-        
-        # Property: Each delay should be called exactly once
-        assert len(actual_delays) == 3, "Should have exactly 3 delay calls"
-        assert all(isinstance(delay, float) for delay in actual_delays), "All delays should be floats"
-        assert all(delay > 0 for delay in actual_delays), "All delays should be positive"
-    
-    def test_order_retry_behavior_database_operations(self):
-        """Test that database operations are only performed on successful orders."""
-        # Create valid order
-        order = Order(
-            market='KRW-BTC',
-            side='bid',
-            ord_type='limit',
-            price=50000.0,
-            volume=0.1,
-            identifier='test_order'
-        )
-        
-        positions = [Position(
-            market='KRW',
-            avg_buy_price=1.0,
-            balance=100000.0,
-            locked=0.0,
-            unit_currency='KRW'
-        )]
-        
-        # Create mock API client that fails twice then succeeds
-        mock_api_client = Mock(spec=UpbitAPIClient)
-        mock_api_client.get_accounts.return_value = positions
-        
-        expected_result = OrderResult(
-            order_id="successful_order_123",
-            market=order.market,
-            side=order.side,
-            ord_type=order.ord_type,
-            price=order.price,
-            volume=order.volume,
-            remaining_volume=order.volume,
-            reserved_fee=0.0,
-            remaining_fee=0.0,
-            paid_fee=0.0,
-            locked=0.0,
-            executed_volume=0.0,
-            trades_count=0
-        )
-        
-        mock_api_client.place_order.side_effect = [
-            UpbitAPIError("First failure"),
-            UpbitAPIError("Second failure"),
-            expected_result  # Success on third attempt
-        ]
-        
-        # Create OrderManager
-        order_manager = OrderManager(api_client=mock_api_client, max_retries=3)
-        
-        # Mock database operations
-        with patch.object(order_manager, '_save_order_to_db') as mock_save_db:
-            with patch('time.sleep'):
-                # Execute order
+        # Execute order (database operations mocked for the DB scenario)
+        if kind == 'database_operations':
+            with patch.object(order_manager, '_save_order_to_db') as mock_save_db:
                 result = order_manager.execute_order(order)
+            
+            # Property: Database save should be called exactly once (only on success)
+            assert mock_save_db.call_count == 1, "Database save should be called exactly once"
+            mock_save_db.assert_called_with(order, _FIXED_RESULT)
+        else:
+            result = order_manager.execute_order(order)
         
-        # Property: Order should succeed after retries
-        assert result is not None, "Order should succeed after retries"
-        assert result.order_id == expected_result.order_id, "Result should match expected result"
-        
-        # Property: Database save should be called exactly once (only on success)
-        assert mock_save_db.call_count == 1, "Database save should be called exactly once"
-        mock_save_db.assert_called_with(order, expected_result)
-        
-        # Property: Active orders should be updated exactly once
-        assert expected_result.order_id in order_manager.active_orders, "Successful order should be added to active orders"
-        assert len(order_manager.active_orders) == 1, "Should have exactly one active order"
-    
-    def test_order_retry_behavior_active_orders_management(self):
-        """Test that active orders are only updated on successful execution."""
-        # Create valid order
-        order = Order(
-            market='KRW-BTC',
-            side='bid',
-            ord_type='limit',
-            price=50000.0,
-            volume=0.1,
-            identifier='test_order'
-        )
-        
-        positions = [Position(
-            market='KRW',
-            avg_buy_price=1.0,
-            balance=100000.0,
-            locked=0.0,
-            unit_currency='KRW'
-        )]
-        
-        # Create mock API client that always fails
-        mock_api_client = Mock(spec=UpbitAPIClient)
-        mock_api_client.get_accounts.return_value = positions
-        mock_api_client.place_order.side_effect = UpbitAPIError("Always fails")
-        
-        # Create OrderManager
-        order_manager = OrderManager(api_client=mock_api_client, max_retries=3)
-        
-        # Verify initial state
-        assert len(order_manager.active_orders) == 0, "Should start with no active orders"
+        # Property: Validation and non-API failures fail immediately, API failures only after all retries
+        assert (result is not None) == succeeds, f"Order should {'succeed' if succeeds else 'fail'}"
+        assert mock_api_client.place_order.call_count == expected_place_calls, f"place_order should be called {expected_place_calls} times"
         
-        # Mock time.sleep
-        with patch('time.sleep'):
-            # Execute order (should fail)
-            result = order_manager.execute_order(order)
+        # Property: Delays should follow exponential backoff pattern
+        assert sleep_calls == expected_delays, f"Sleep delays should be {expected_delays}, got {sleep_calls}"
+        assert all(isinstance(delay, float) and delay > 0 for delay in sleep_calls), "All delays should be positive floats"
         
-        # Property: Failed order should not be added to active orders
-        assert result is None, "Order should fail"
-        assert len(order_manager.active_orders) == 0, "Failed order should not be added to active orders"
-        
-        # Now test successful case
-        expected_result = OrderResult(
-            order_id="successful_order_456",
-            market=order.market,
-            side=order.side,
-            ord_type=order.ord_type,
-            price=order.price,
-            volume=order.volume,
-            remaining_volume=order.volume,
-            reserved_fee=0.0,
-            remaining_fee=0.0,
-            paid_fee=0.0,
-            locked=0.0,
-            executed_volume=0.0,
-            trades_count=0
-        )
-        mock_api_client.place_order.side_effect = None
-        mock_api_client.place_order.return_value = expected_result
+        # Property: Active orders are only updated on successful execution
+        if succeeds:
+            assert result.order_id == _FIXED_RESULT.order_id, "Result should match expected result"
+            assert list(order_manager.active_orders) == [_FIXED_RESULT.order_id], "Should have exactly one active order"
+        else:
+            assert len(order_manager.active_orders) == 0, "Failed order should not be added to active orders"
         
-        with patch('time.sleep'):
-            # Execute order (should succeed)
+        if kind == 'active_orders_management':
+            # Now test successful case on the same manager
+            mock_api_client.place_order.side_effect = None
+            mock_api_client.place_order.return_value = _FIXED_RESULT
+            
             result = order_manager.execute_order(order)
-        
-        # Property: Successful order should be added to active orders
-        assert result is not None, "Order should succeed"
-        assert len(order_manager.active_orders) == 1, "Successful order should be added to active orders"
-        assert expected_result.order_id in order_manager.active_orders, "Order ID should be in active orders"
\ No newline at end of file
+            
+            # Property: Successful order should be added to active orders
+            assert result is not None, "Order should succeed"
+            assert list(order_manager.active_orders) == [_FIXED_RESULT.order_id], "Order ID should be in active orders"
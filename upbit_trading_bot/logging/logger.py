@@ -152,12 +152,21 @@ class LoggerManager:
         error_handler.setFormatter(file_formatter)
         root_logger.addHandler(error_handler)
         
+        # Handlers owned by this manager (flushed together by flush_all)
+        self._handlers = [file_handler, error_handler]
+        
         # Console handler
         if self.console_output:
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setLevel(self.log_level)
             console_handler.setFormatter(console_formatter)
             root_logger.addHandler(console_handler)
+            self._handlers.append(console_handler)
+    
+    def flush_all(self) -> None:
+        """Flush every handler configured by this manager."""
+        for handler in self._handlers:
+            handler.flush()
     
     def get_logger(self, name: str) -> logging.Logger:
         """